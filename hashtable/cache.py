@@ -0,0 +1,193 @@
+import time
+
+from hashtable import HashTable
+
+# Bounded cache built on HashTable
+# The HashTable maps student_id -> CacheEntry (stored as the entry's student_name), so lookups stay O(1),
+# while the CacheEntry objects are also threaded onto intrusive doubly-linked lists that give O(1) eviction:
+#   LRU -> one list ordered from least to most recently used
+#   LFU -> one list per use count, plus the smallest count currently in use; ties evict the least recent
+
+
+class CacheEntry:
+    """Cached student record plus its eviction bookkeeping"""
+    __slots__ = ("student_id", "student_name", "status", "expires_at", "frequency", "prev", "next")
+
+    def __init__(self, student_id, student_name: str, expires_at: float):
+        self.student_id = student_id
+        self.student_name = student_name
+        self.status = True
+        self.expires_at = expires_at
+        self.frequency = 1
+        self.prev = None
+        self.next = None
+
+
+class _EntryList:
+    """Circular doubly-linked list of CacheEntry with a sentinel; oldest first"""
+
+    def __init__(self):
+        self.head = CacheEntry(None, None, None)
+        self.head.prev = self.head.next = self.head
+        self.length = 0
+
+    def append(self, entry: CacheEntry) -> None:
+        last = self.head.prev
+        entry.prev, entry.next = last, self.head
+        last.next = entry
+        self.head.prev = entry
+        self.length += 1
+
+    def unlink(self, entry: CacheEntry) -> None:
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.prev = entry.next = None
+        self.length -= 1
+
+    def oldest(self) -> CacheEntry:
+        return self.head.next
+
+
+class BoundedCache:
+    POLICIES = ("lru", "lfu")
+
+    def __init__(self, capacity: int, policy: str = "lru", ttl: float = None,
+                 clock=time.monotonic, **table_kwargs):
+        """Initialize a cache holding at most capacity students
+
+        policy picks the victim when full ("lru" or "lfu"). With ttl, entries
+        older than ttl seconds (measured by clock) are treated as missing.
+        table_kwargs are passed to the underlying HashTable.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.ttl = ttl
+        self.clock = clock
+        self.table = HashTable(max(1, int(capacity / table_kwargs.get("max_load_factor", 0.75)) + 1),
+                               **table_kwargs)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._reset_order()
+
+    def _reset_order(self) -> None:
+        """Empty the eviction lists"""
+        self.recency = _EntryList()
+        self.frequency_lists = {}
+        self.min_frequency = 0
+
+    def size(self) -> int:
+        """Return current number of cached students"""
+        return self.table.size()
+
+    def hit_rate(self) -> float:
+        """Return hits / lookups, or 0.0 before the first lookup"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _track(self, entry: CacheEntry) -> None:
+        """Add a freshly inserted entry to the eviction order"""
+        if self.policy == "lru":
+            self.recency.append(entry)
+            return
+        entry.frequency = 1
+        self.frequency_lists.setdefault(1, _EntryList()).append(entry)
+        self.min_frequency = 1
+
+    def _untrack(self, entry: CacheEntry) -> None:
+        """Remove an entry from the eviction order"""
+        if self.policy == "lru":
+            self.recency.unlink(entry)
+            return
+        entries = self.frequency_lists[entry.frequency]
+        entries.unlink(entry)
+        if entries.length == 0:
+            del self.frequency_lists[entry.frequency]
+
+    def _touch(self, entry: CacheEntry) -> None:
+        """Record a use of entry"""
+        if self.policy == "lru":
+            self.recency.unlink(entry)
+            self.recency.append(entry)
+            return
+        self._untrack(entry)
+        if entry.frequency == self.min_frequency and entry.frequency not in self.frequency_lists:
+            self.min_frequency += 1
+        entry.frequency += 1
+        self.frequency_lists.setdefault(entry.frequency, _EntryList()).append(entry)
+
+    def _evict(self) -> None:
+        """Drop the least recently / least frequently used entry"""
+        if self.policy == "lru":
+            victim = self.recency.oldest()
+        else:
+            victim = self.frequency_lists[self.min_frequency].oldest()
+        self._discard(victim)
+        self.evictions += 1
+
+    def _discard(self, entry: CacheEntry) -> None:
+        self._untrack(entry)
+        entry.status = False
+        self.table.rem(entry.student_id)
+
+    def _lookup(self, student_id) -> CacheEntry:
+        """Find a live, unexpired entry without touching hit counters"""
+        stored = self.table.get(student_id)
+        if stored is None:
+            return None
+        entry = stored.student_name
+        if entry.expires_at is not None and entry.expires_at <= self.clock():
+            self._discard(entry)
+            self.expirations += 1
+            return None
+        return entry
+
+    def get(self, student_id) -> CacheEntry:
+        """Retrieve the cached student entry by ID, counting a hit or a miss"""
+        entry = self._lookup(student_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touch(entry)
+        return entry
+
+    def contains(self, student_id) -> bool:
+        """Check if an unexpired student is cached, without counting it as a use"""
+        return self._lookup(student_id) is not None
+
+    def set(self, student_id, student_name: str) -> None:
+        """Add or update a cached student, evicting one entry when full"""
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        entry = self._lookup(student_id)
+        if entry is not None:
+            entry.student_name = student_name
+            entry.expires_at = expires_at
+            self._touch(entry)
+            return
+
+        if self.table.size() >= self.capacity:
+            self._evict()
+
+        entry = CacheEntry(student_id, student_name, expires_at)
+        self.table.set(student_id, entry)
+        self._track(entry)
+
+    def rem(self, student_id) -> None:
+        """Drop a student from the cache"""
+        stored = self.table.get(student_id)
+        if stored is not None:
+            self._discard(stored.student_name)
+
+    def reset(self) -> None:
+        """Clear all entries; hit/miss/eviction counters are kept"""
+        self.table.reset()
+        self._reset_order()
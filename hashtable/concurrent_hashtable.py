@@ -0,0 +1,212 @@
+import threading
+import weakref
+from contextlib import contextmanager
+
+from hashtable import HashTable, _as_id_list, _bucket_indexer
+
+# Thread-safe HashTable using lock striping
+# Bucket i is guarded by stripe lock i % stripes, so threads working on different stripes never wait on each other.
+# Resizing, reset and full compaction take every stripe lock (always in stripe order, so they cannot deadlock),
+# which means any thread holding a stripe lock sees a bucket array that cannot be swapped out from under it.
+# Shared counters are only touched while holding a stripe lock plus the small counter lock.
+
+
+class ConcurrentHashTable(HashTable):
+
+    def __init__(self, total_size: int, stripes: int = 16, **kwargs):
+        """Initialize a thread-safe table; kwargs are passed through to HashTable"""
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        if kwargs.get("incremental_rehash"):
+            raise ValueError("incremental_rehash is not supported by ConcurrentHashTable")
+
+        super().__init__(total_size, **kwargs)
+        self.stripes = stripes
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._counter_lock = threading.Lock()
+        # (bucket list, indexer) pair, swapped as one object so a reader never mixes generations
+        self._list_indexer = (self.student_list, self._slot_index)
+
+    @contextmanager
+    def _all_locks(self):
+        """Hold every stripe lock, acquired in a fixed order"""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def _lock_slot(self, student_id) -> tuple:
+        """Acquire the stripe lock guarding student_id's bucket; returns (lock, slot)"""
+        while True:
+            student_list = self.student_list
+            list_indexer = self._list_indexer
+            if list_indexer[0] is not student_list:
+                list_indexer = (student_list, _bucket_indexer(self.hash_function, len(student_list)))
+                self._list_indexer = list_indexer
+            idx = list_indexer[1](student_id)
+            lock = self._locks[idx % self.stripes]
+            lock.acquire()
+            # A resize may have swapped the bucket array while we waited
+            if student_list is self.student_list:
+                return lock, student_list[idx]
+            lock.release()
+
+    def _add_counts(self, live_delta: int, dead_delta: int) -> None:
+        """Adjust the shared size counters (caller holds a stripe lock)"""
+        with self._counter_lock:
+            self.current_size += live_delta
+            self.dead_size += dead_delta
+
+    def get(self, student_id) -> HashTable.StudentData:
+        """Retrieve a copy of the active student entry by ID
+
+        A copy is returned because the stored entry may be reused by another
+        thread as soon as the stripe lock is released.
+        """
+        lock, slot = self._lock_slot(student_id)
+        try:
+            for entry in slot:
+                if entry.status and entry.student_id == student_id:
+                    return self.StudentData(entry.student_id, entry.student_name)
+            return None
+        finally:
+            lock.release()
+
+    def contains(self, student_id) -> bool:
+        """Check if student exists and is active in hash table"""
+        lock, slot = self._lock_slot(student_id)
+        try:
+            for entry in slot:
+                if entry.status and entry.student_id == student_id:
+                    return True
+            return False
+        finally:
+            lock.release()
+
+    def set(self, student_id, student_name: str) -> None:
+        """Atomically add or update a student entry"""
+        lock, slot = self._lock_slot(student_id)
+        try:
+            empty_entry = None
+            for entry in slot:
+                if entry.status:
+                    if entry.student_id == student_id:
+                        entry.student_name = student_name
+                        return
+                elif empty_entry is None:
+                    empty_entry = entry
+
+            if empty_entry:
+                empty_entry.student_id = student_id
+                empty_entry.student_name = student_name
+                empty_entry.status = True
+                self._add_counts(1, -1)
+            else:
+                slot.append(self.StudentData(student_id, student_name))
+                self._add_counts(1, 0)
+        finally:
+            lock.release()
+
+        self._maybe_grow()
+
+    def rem(self, student_id) -> None:
+        """Atomically mark a student entry as inactive"""
+        lock, slot = self._lock_slot(student_id)
+        try:
+            for entry in slot:
+                if entry.status and entry.student_id == student_id:
+                    entry.status = False
+                    dead_in_slot = sum(1 for other in slot if not other.status)
+                    if len(slot) >= 4 and dead_in_slot > self.tombstone_ratio * len(slot):
+                        slot[:] = [other for other in slot if other.status]
+                        self._add_counts(-1, 1 - dead_in_slot)
+                    else:
+                        self._add_counts(-1, 1)
+                    break
+            else:
+                return
+        finally:
+            lock.release()
+
+        if self._table_needs_compaction():
+            self.compact()
+        self._maybe_shrink()
+
+    def set_many(self, students) -> None:
+        """Add or update many (student_id, student_name) pairs, presizing once"""
+        students = students if isinstance(students, list) else list(students)
+        with self._all_locks():
+            self.reserve(self.current_size + len(students))
+        for student_id, student_name in students:
+            self.set(student_id, student_name)
+
+    def get_many(self, student_ids) -> list:
+        """Retrieve a copy of the active entry (or None) for each id, in order"""
+        return [self.get(student_id) for student_id in _as_id_list(student_ids)]
+
+    def _instrumented_operations(self) -> dict:
+        """Wrap the locked operations with probe counting
+
+        The base class counts probes inside its own lookups, which here would
+        bypass the stripe locks. Instead each instrumented call scans the
+        key's chain once more before running the locked operation, so stats
+        roughly double the cost of get/set/contains on this table.
+        """
+        table_ref = weakref.ref(self)
+        operations = {}
+        for operation in self.INSTRUMENTED_OPERATIONS:
+            operations[operation] = self._rescan_instrumented(getattr(type(self), operation),
+                                                              self._stats[operation], table_ref)
+        return operations
+
+    @staticmethod
+    def _rescan_instrumented(method, counters, table_ref):
+        """Wrap one locked operation so each call records its probe length first"""
+        def instrumented(*args, **kwargs):
+            table = table_ref()
+            student_id = args[0] if args else kwargs["student_id"]
+            probes = table._find_counting(student_id)[1]
+            with table._counter_lock:
+                counters[0] += 1
+                counters[1] += probes
+                if probes > counters[2]:
+                    counters[2] = probes
+            return method(table, *args, **kwargs)
+
+        instrumented.__doc__ = method.__doc__
+        return instrumented
+
+    def resize(self, new_size: int) -> None:
+        """Rehash into new_size buckets while holding every stripe lock"""
+        with self._all_locks():
+            self._rehash_into(new_size)
+
+    def _maybe_grow(self) -> None:
+        """Double the bucket count, re-checking the load factor under the locks"""
+        if self.current_size > self.max_load_factor * self.total_size:
+            with self._all_locks():
+                # Another thread may have grown the table while we waited
+                if self.current_size > self.max_load_factor * self.total_size:
+                    self._rehash_into(self.total_size * 2)
+
+    def _maybe_shrink(self) -> None:
+        """Halve the bucket count, re-checking the load factor under the locks"""
+        if (self.total_size > self.initial_size
+                and self.current_size < self.min_load_factor * self.total_size):
+            with self._all_locks():
+                if (self.total_size > self.initial_size
+                        and self.current_size < self.min_load_factor * self.total_size):
+                    self._rehash_into(max(self.initial_size, self.total_size // 2))
+
+    def compact(self) -> None:
+        """Purge every inactive entry while holding every stripe lock"""
+        with self._all_locks():
+            super().compact()
+
+    def reset(self) -> None:
+        """Clear all entries while holding every stripe lock"""
+        with self._all_locks():
+            super().reset()
@@ -1,3 +1,11 @@
+import mmap as mmap_module
+import operator
+import random
+import struct
+import sys
+import weakref
+from array import array
+
 # my version
 
 class HashTable:
@@ -117,6 +125,40 @@ class HashTable:
 #
 # co-pilot version
 
+_FIBONACCI_MULTIPLIER = 0x9E3779B97F4A7C15  # 2^64 / golden ratio
+_MASK_64 = (1 << 64) - 1
+
+# Snapshot file layout (see HashTable.save), all integers little-endian:
+#   header        magic, bucket count B, entry count N, name blob size
+#   bucket_starts (B + 1) uint64, entries of bucket b are [bucket_starts[b], bucket_starts[b + 1])
+#   ids           N int64
+#   name_starts   (N + 1) uint64 offsets into the name blob
+#   names         UTF-8 names back to back
+_SNAPSHOT_MAGIC = b"HTSNAP01"
+_SNAPSHOT_HEADER = struct.Struct("<8sQQQ")
+
+
+def fibonacci_hash(key) -> int:
+    """Multiplicative (Fibonacci) hash: spreads ids that share low digits or a common stride"""
+    # The low bits of the product only depend on the low bits of the key, so keep the high half
+    return ((hash(key) * _FIBONACCI_MULTIPLIER) & _MASK_64) >> 32
+
+
+def seeded_hash(seed: int):
+    """Build a hash function salted with seed, so bucket placement differs per table"""
+    def hash_function(key) -> int:
+        return hash((seed, key))
+    return hash_function
+
+
+def _bucket_indexer(hash_function, total_size: int):
+    """Build key -> bucket index for total_size buckets, masking when total_size is a power of two"""
+    if total_size & (total_size - 1) == 0:
+        mask = total_size - 1
+        return lambda key: hash_function(key) & mask
+    return lambda key: hash_function(key) % total_size
+
+
 class HashTable:
     class StudentData:
         """Inner class representing a student record"""
@@ -125,65 +167,377 @@ class HashTable:
             self.student_name = student_name
             self.status = True
 
-    def __init__(self, total_size: int):
-        """Initialize hash table with specified size"""
+    def __init__(self, total_size: int, max_load_factor: float = 0.75,
+                 min_load_factor: float = 0.0, incremental_rehash: bool = False,
+                 rehash_step: int = 2, tombstone_ratio: float = 0.5,
+                 hash_function="builtin", hash_seed: int = None):
+        """Initialize hash table with specified size and resize thresholds
+
+        The table doubles once size / total_size exceeds max_load_factor and
+        halves (never below the initial size) once it drops under
+        min_load_factor. A min_load_factor of 0 disables shrinking.
+
+        With incremental_rehash the old bucket array is kept alongside the new
+        one and rehash_step buckets are migrated on every set/get/rem/contains
+        call, instead of rehashing everything on the call that hits the limit.
+
+        Removed entries stay behind as inactive tombstones that set() can
+        reuse. Once tombstones make up more than tombstone_ratio of a bucket
+        they are purged from it. The whole table is swept once they also
+        outnumber tombstone_ratio of all entries and of the bucket count, so
+        each O(buckets) sweep is paid for by that many removals.
+
+        Keys can be any hashable value. hash_function is "builtin" (hash(),
+        so int ids map to id % total_size), "fibonacci", "seeded" (salted with
+        hash_seed, random if omitted) or any callable returning an int. When
+        total_size is a power of two buckets are picked by masking instead of %.
+        """
+        if total_size < 1:
+            raise ValueError("total_size must be at least 1")
+        if max_load_factor <= 0:
+            raise ValueError("max_load_factor must be positive")
+        if not 0 <= min_load_factor < max_load_factor / 2:
+            raise ValueError("min_load_factor must be in [0, max_load_factor / 2)")
+        if rehash_step < 1:
+            raise ValueError("rehash_step must be at least 1")
+        if not 0 < tombstone_ratio <= 1:
+            raise ValueError("tombstone_ratio must be in (0, 1]")
+
+        if hash_function == "builtin":
+            hash_function = hash
+        elif hash_function == "fibonacci":
+            hash_function = fibonacci_hash
+        elif hash_function == "seeded":
+            hash_function = seeded_hash(random.getrandbits(64) if hash_seed is None else hash_seed)
+        elif not callable(hash_function):
+            raise ValueError(f"Unknown hash_function: {hash_function!r}")
+        self.hash_function = hash_function
+
+        self.initial_size = total_size
         self.total_size = total_size
+        # Picked once per bucket count so lookups never re-check for a power of two
+        self._slot_index = _bucket_indexer(hash_function, total_size)
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
         self.student_list = [[] for _ in range(total_size)]
         self.current_size = 0
+        self.dead_size = 0
+        self.tombstone_ratio = tombstone_ratio
+
+        self.incremental_rehash = incremental_rehash
+        self.rehash_step = rehash_step
+        # Bucket array being drained while an incremental rehash is running
+        self.old_student_list = None
+        self.old_total_size = 0
+        self._old_slot_index = None
+        self.rehash_idx = 0
+
+        # Probe/resize counters, only allocated by enable_stats()
+        self._stats = None
 
     def size(self) -> int:
         """Return current number of active entries"""
         return self.current_size
+
+    def live_count(self) -> int:
+        """Return number of active entries (same as size())"""
+        return self.current_size
+
+    def dead_count(self) -> int:
+        """Return number of inactive entries still occupying buckets"""
+        return self.dead_size
     
-    def contains(self, student_id: int) -> bool:
+    def contains(self, student_id) -> bool:
         """Check if student exists and is active in hash table"""
-        slot = self.get_slot(student_id)
-        return any(
-            entry.status and entry.student_id == student_id 
-            for entry in slot
-        )
+        if self.old_student_list is None:
+            for entry in self.student_list[self._slot_index(student_id)]:
+                if entry.status and entry.student_id == student_id:
+                    return True
+            return False
+        self._rehash_some()
+        return self._find(student_id) is not None
 
-    def get_slot(self, student_id: int) -> list:
+    def get_slot(self, student_id) -> list:
         """Get the appropriate slot for a student ID"""
-        return self.student_list[student_id % self.total_size]
+        return self.student_list[self._slot_index(student_id)]
+
+    def _candidate_slots(self, student_id) -> tuple:
+        """Slots that may hold student_id, including the old one mid-rehash"""
+        slot = self.get_slot(student_id)
+        if self.old_student_list is None:
+            return (slot,)
+        return (slot, self.old_student_list[self._old_slot_index(student_id)])
+
+    def _find(self, student_id) -> "StudentData":
+        """Locate an active entry without advancing an incremental rehash"""
+        for slot in self._candidate_slots(student_id):
+            for entry in slot:
+                if entry.status and entry.student_id == student_id:
+                    return entry
+        return None
+
+    def is_rehashing(self) -> bool:
+        """Return True while an incremental rehash is still migrating buckets"""
+        return self.old_student_list is not None
+
+    def load_factor(self) -> float:
+        """Return the ratio of active entries to buckets"""
+        return self.current_size / self.total_size
+
+    def resize(self, new_size: int) -> None:
+        """Rehash every active entry into new_size buckets, dropping inactive ones
+
+        In incremental mode this only swaps in the new bucket array; entries
+        are migrated a few buckets at a time by later operations.
+        """
+        if not self.incremental_rehash:
+            self._rehash_into(new_size)
+            return
+
+        # A previous incremental rehash must be drained before starting another
+        self._finish_rehash()
+
+        if self._stats is not None:
+            self._stats["resizes"].append((self.total_size, new_size))
+        self.old_student_list = self.student_list
+        self.old_total_size = self.total_size
+        self._old_slot_index = self._slot_index
+        self.rehash_idx = 0
+        self.total_size = new_size
+        self._slot_index = _bucket_indexer(self.hash_function, new_size)
+        self.student_list = [[] for _ in range(new_size)]
+
+    def _rehash_into(self, new_size: int) -> None:
+        """Move every active entry into new_size buckets in one pass"""
+        self._finish_rehash()
+
+        if self._stats is not None:
+            self._stats["resizes"].append((self.total_size, new_size))
+        old_list = self.student_list
+        self.total_size = new_size
+        self._slot_index = _bucket_indexer(self.hash_function, new_size)
+        self.student_list = [[] for _ in range(new_size)]
+        for slot in old_list:
+            for entry in slot:
+                if entry.status:
+                    self.get_slot(entry.student_id).append(entry)
+        self.dead_size = 0
+
+    def _rehash_some(self, buckets: int = None) -> None:
+        """Migrate up to `buckets` (default rehash_step) old buckets to the new array"""
+        if self.old_student_list is None:
+            return
+
+        remaining = self.rehash_step if buckets is None else buckets
+        old_list = self.old_student_list
+        while remaining > 0 and self.rehash_idx < self.old_total_size:
+            slot = old_list[self.rehash_idx]
+            for entry in slot:
+                if entry.status:
+                    self.get_slot(entry.student_id).append(entry)
+                else:
+                    self.dead_size -= 1
+            slot.clear()
+            self.rehash_idx += 1
+            remaining -= 1
+
+        if self.rehash_idx >= self.old_total_size:
+            self.old_student_list = None
+            self.old_total_size = 0
+            self._old_slot_index = None
+            self.rehash_idx = 0
+
+    def _finish_rehash(self) -> None:
+        """Migrate every remaining old bucket"""
+        if self.old_student_list is not None:
+            self._rehash_some(self.old_total_size - self.rehash_idx)
+
+    def compact(self) -> None:
+        """Purge every inactive entry from every bucket"""
+        buckets = self.student_list
+        if self.old_student_list is not None:
+            buckets = buckets + self.old_student_list
+        for slot in buckets:
+            self._compact_slot(slot)
+
+    def _compact_slot(self, slot: list) -> None:
+        """Drop inactive entries from a single bucket"""
+        live = [entry for entry in slot if entry.status]
+        self.dead_size -= len(slot) - len(live)
+        slot[:] = live
+
+    def _maybe_compact(self, slot: list) -> None:
+        """Purge tombstones from slot, or the whole table, past tombstone_ratio"""
+        if len(slot) >= 4:
+            dead_in_slot = sum(1 for entry in slot if not entry.status)
+            if dead_in_slot > self.tombstone_ratio * len(slot):
+                self._compact_slot(slot)
+
+        if self._table_needs_compaction():
+            self.compact()
+
+    def _table_needs_compaction(self) -> bool:
+        """True once a full compact() sweep is worth its O(buckets + entries) cost"""
+        dead_size = self.dead_size
+        # Small absolute floor so a handful of deletes does not walk the table, and
+        # a bucket-count floor so sparse tables are not swept every few removals
+        return (dead_size >= 8
+                and dead_size > self.tombstone_ratio * (self.current_size + dead_size)
+                and dead_size > self.tombstone_ratio * self.total_size)
+
+    def reserve(self, expected_size: int) -> None:
+        """Grow up front so expected_size entries fit under max_load_factor
+
+        In incremental mode this starts an incremental rehash like resize().
+        """
+        new_size = self.total_size
+        while expected_size > self.max_load_factor * new_size:
+            new_size *= 2
+        if new_size == self.total_size:
+            return
+        if self.incremental_rehash:
+            self.resize(new_size)
+        else:
+            self._rehash_into(new_size)
+
+    def _maybe_grow(self) -> None:
+        """Double the bucket count once the max load factor is exceeded"""
+        if self.current_size > self.max_load_factor * self.total_size:
+            self.resize(self.total_size * 2)
+
+    def _maybe_shrink(self) -> None:
+        """Halve the bucket count once the load factor falls under the minimum"""
+        if (self.total_size > self.initial_size
+                and self.current_size < self.min_load_factor * self.total_size):
+            self.resize(max(self.initial_size, self.total_size // 2))
     
     def reset(self) -> None:
         """Clear all entries from the hash table"""
+        self.old_student_list = None
+        self.old_total_size = 0
+        self._old_slot_index = None
+        self.rehash_idx = 0
+        if self.total_size != self.initial_size:
+            self.total_size = self.initial_size
+            self._slot_index = _bucket_indexer(self.hash_function, self.initial_size)
+            self.student_list = [[] for _ in range(self.initial_size)]
         for slot in self.student_list:
             slot.clear()
         self.current_size = 0
+        self.dead_size = 0
     
-    def set(self, student_id: int, student_name: str) -> None:
+    def set(self, student_id, student_name: str) -> None:
         """Add or update a student entry"""
-        # Check if student exists
-        current_entry = self.get(student_id)
-        if current_entry:
-            current_entry.student_name = student_name
-            return
+        if self.old_student_list is not None:
+            self._rehash_some()
+            # Mid-rehash the student may still sit in its old bucket
+            if self.old_student_list is not None:
+                current_entry = self._find(student_id)
+                if current_entry:
+                    current_entry.student_name = student_name
+                    return
 
-        # Try to find empty slot
-        slot = self.get_slot(student_id)
-        empty_entry = self.search_for_empty_entry(slot)
+        if self._upsert(self.student_list[self._slot_index(student_id)],
+                        student_id, student_name):
+            self.current_size += 1
+            self._maybe_grow()
+
+    def _upsert(self, slot: list, student_id, student_name: str) -> bool:
+        """Update or insert within one bucket in a single scan; True if a new entry was added"""
+        empty_entry = None
+        for entry in slot:
+            if entry.status:
+                if entry.student_id == student_id:
+                    entry.student_name = student_name
+                    return False
+            elif empty_entry is None:
+                empty_entry = entry
 
         if empty_entry:
+            # Reuse the first tombstone seen on the way
             empty_entry.student_id = student_id
             empty_entry.student_name = student_name
             empty_entry.status = True
+            self.dead_size -= 1
         else:
             # Create new entry if no empty slot found
-            student = self.StudentData(student_id, student_name)
-            slot.append(student)
-            
-        self.current_size += 1
+            slot.append(self.StudentData(student_id, student_name))
+        return True
+
+    def set_many(self, students) -> None:
+        """Add or update many (student_id, student_name) pairs at once
+
+        The table is grown once up front for the whole batch instead of
+        doubling repeatedly while the batch is inserted. During an
+        incremental rehash each pair goes through set(), which checks the
+        old bucket array and migrates rehash_step buckets per pair.
+        """
+        students = students if isinstance(students, list) else list(students)
+        self.reserve(self.current_size + len(students))
+        if self.old_student_list is not None:
+            for student_id, student_name in students:
+                self.set(student_id, student_name)
+            return
+
+        upsert = self._upsert
+        slot_index = self._slot_index
+        student_list = self.student_list
+        added = 0
+        for student_id, student_name in students:
+            added += upsert(student_list[slot_index(student_id)],
+                            student_id, student_name)
+
+        self.current_size += added
+        self._maybe_grow()
 
-    def rem(self, student_id: int) -> None:
+    def get_many(self, student_ids) -> list:
+        """Retrieve the active entry (or None) for each id, in order
+
+        student_ids may be any iterable of keys, including a NumPy array.
+        During an incremental rehash both bucket arrays are searched and
+        rehash_step buckets are migrated per id, as with get().
+        """
+        student_ids = _as_id_list(student_ids)
+        if self.old_student_list is not None:
+            result = []
+            for student_id in student_ids:
+                self._rehash_some()
+                result.append(self._find(student_id))
+            return result
+
+        slot_index = self._slot_index
+        student_list = self.student_list
+        result = []
+        for student_id in student_ids:
+            found = None
+            for entry in student_list[slot_index(student_id)]:
+                if entry.status and entry.student_id == student_id:
+                    found = entry
+                    break
+            result.append(found)
+        return result
+
+    def contains_many(self, student_ids) -> list:
+        """Return a bool per id telling whether it is an active entry"""
+        return [entry is not None for entry in self.get_many(student_ids)]
+
+    def rem(self, student_id) -> None:
         """Mark a student entry as inactive"""
-        slot = self.get_slot(student_id)
-        for entry in slot:
-            if entry.student_id == student_id:
-                entry.status = False
-                self.current_size -= 1
-                break
+        if self.old_student_list is None:
+            slots = (self.student_list[self._slot_index(student_id)],)
+        else:
+            self._rehash_some()
+            slots = self._candidate_slots(student_id)
+        for slot in slots:
+            for entry in slot:
+                # Already-removed entries must not be counted twice
+                if entry.status and entry.student_id == student_id:
+                    entry.status = False
+                    self.current_size -= 1
+                    self.dead_size += 1
+                    self._maybe_compact(slot)
+                    self._maybe_shrink()
+                    return
     
     def search_for_empty_entry(self, slot: list) -> StudentData:
         """Find first inactive entry in a slot"""
@@ -192,10 +546,316 @@ class HashTable:
                 return entry
         return None
     
-    def get(self, student_id: int) -> StudentData:
+    def get(self, student_id) -> StudentData:
         """Retrieve active student entry by ID"""
-        slot = self.get_slot(student_id)
-        for entry in slot:
-            if entry.status and entry.student_id == student_id:
-                return entry
-        return None
\ No newline at end of file
+        # Fast path: no rehash in progress, so only the one bucket can hold the key
+        if self.old_student_list is None:
+            for entry in self.student_list[self._slot_index(student_id)]:
+                if entry.status and entry.student_id == student_id:
+                    return entry
+            return None
+        self._rehash_some()
+        return self._find(student_id)
+
+    INSTRUMENTED_OPERATIONS = ("get", "set", "contains")
+
+    def enable_stats(self) -> None:
+        """Start recording probe counts per get/set/contains and resize events
+
+        The instrumented operations are installed on this instance only, so a
+        table that never calls enable_stats() runs the plain methods with no
+        extra checks. While enabled, get/contains and updating sets count
+        probes during their own single chain scan; only a set that inserts a
+        new key scans its bucket a second time (for a tombstone to reuse).
+        """
+        self._stats = {"resizes": []}
+        for operation in self.INSTRUMENTED_OPERATIONS:
+            # [calls, total probes, max probes]
+            self._stats[operation] = [0, 0, 0]
+        for operation, function in self._instrumented_operations().items():
+            setattr(self, operation, function)
+
+    def disable_stats(self) -> None:
+        """Stop recording and restore the plain operations"""
+        for operation in self.INSTRUMENTED_OPERATIONS:
+            self.__dict__.pop(operation, None)
+        self._stats = None
+
+    def _instrumented_operations(self) -> dict:
+        """Counting versions of get/set/contains, keyed by operation name
+
+        They reach the table through a weak reference, so storing them on the
+        instance does not create a reference cycle.
+        """
+        table_ref = weakref.ref(self)
+        get_counters, set_counters, contains_counters = (self._stats[operation]
+                                                         for operation in self.INSTRUMENTED_OPERATIONS)
+
+        def counted_find(student_id, counters):
+            table = table_ref()
+            if table.old_student_list is None:
+                # Same single-bucket fast path as the plain operations
+                entry = None
+                probes = 0
+                for candidate in table.student_list[table._slot_index(student_id)]:
+                    probes += 1
+                    if candidate.status and candidate.student_id == student_id:
+                        entry = candidate
+                        break
+            else:
+                table._rehash_some()
+                entry, probes = table._find_counting(student_id)
+            counters[0] += 1
+            counters[1] += probes
+            if probes > counters[2]:
+                counters[2] = probes
+            return table, entry
+
+        def get(student_id):
+            return counted_find(student_id, get_counters)[1]
+
+        def contains(student_id):
+            return counted_find(student_id, contains_counters)[1] is not None
+
+        def set(student_id, student_name):
+            table, entry = counted_find(student_id, set_counters)
+            if entry is not None:
+                entry.student_name = student_name
+            elif table._upsert(table.student_list[table._slot_index(student_id)], student_id, student_name):
+                table.current_size += 1
+                table._maybe_grow()
+
+        operations = {"get": get, "set": set, "contains": contains}
+        for operation, function in operations.items():
+            function.__doc__ = getattr(type(self), operation).__doc__
+        return operations
+
+    def _find_counting(self, student_id) -> tuple:
+        """_find() that also returns the entries (tombstones included) it examined"""
+        probes = 0
+        for slot in self._candidate_slots(student_id):
+            for entry in slot:
+                probes += 1
+                if entry.status and entry.student_id == student_id:
+                    return entry, probes
+        return None, probes
+
+    def stats(self) -> dict:
+        """Snapshot of table health, suitable for exporting to a metrics pipeline
+
+        Load factor, chain lengths and tombstones are computed on demand and
+        always available. Per-operation probe counts and resize events are
+        only present after enable_stats().
+        """
+        buckets = self.student_list
+        if self.old_student_list is not None:
+            buckets = buckets + self.old_student_list
+
+        chain_lengths = {}
+        for slot in buckets:
+            chain_lengths[len(slot)] = chain_lengths.get(len(slot), 0) + 1
+
+        stored = self.current_size + self.dead_size
+        report = {
+            "size": self.current_size,
+            "buckets": self.total_size,
+            "load_factor": self.load_factor(),
+            "dead": self.dead_size,
+            "tombstone_ratio": self.dead_size / stored if stored else 0.0,
+            "chain_length_histogram": dict(sorted(chain_lengths.items())),
+            "max_chain_length": max(chain_lengths),
+            "rehashing": self.is_rehashing(),
+        }
+        if self._stats is not None:
+            report["resizes"] = list(self._stats["resizes"])
+            for operation in self.INSTRUMENTED_OPERATIONS:
+                calls, total_probes, max_probes = self._stats[operation]
+                report[operation] = {
+                    "calls": calls,
+                    "avg_probes": total_probes / calls if calls else 0.0,
+                    "max_probes": max_probes,
+                }
+        return report
+
+    def _live_entries(self):
+        """Yield every active entry, including ones still in the old array mid-rehash"""
+        buckets = self.student_list
+        if self.old_student_list is not None:
+            buckets = buckets + self.old_student_list
+        for slot in buckets:
+            for entry in slot:
+                if entry.status:
+                    yield entry
+
+    def save(self, path: str) -> None:
+        """Write a compact binary snapshot that load() can memory-map
+
+        Only int64 student ids and str names can be saved. Buckets in the file
+        always use fibonacci_hash, whatever hash_function this table uses, so
+        any process can look keys up in the snapshot.
+        """
+        entries = list(self._live_entries())
+        for entry in entries:
+            if not isinstance(entry.student_id, int) or not isinstance(entry.student_name, str):
+                raise TypeError("only int student ids and str names can be saved")
+
+        num_buckets = 1
+        while num_buckets < len(entries):
+            num_buckets <<= 1
+        mask = num_buckets - 1
+
+        # Counting sort of the entries by snapshot bucket
+        bucket_of = [fibonacci_hash(entry.student_id) & mask for entry in entries]
+        bucket_starts = array('Q', bytes(8 * (num_buckets + 1)))
+        for bucket in bucket_of:
+            bucket_starts[bucket + 1] += 1
+        for bucket in range(num_buckets):
+            bucket_starts[bucket + 1] += bucket_starts[bucket]
+
+        ordered = [None] * len(entries)
+        next_free = bucket_starts[:-1]
+        for entry, bucket in zip(entries, bucket_of):
+            ordered[next_free[bucket]] = entry
+            next_free[bucket] += 1
+
+        ids = array('q', [entry.student_id for entry in ordered])
+        encoded_names = [entry.student_name.encode("utf-8") for entry in ordered]
+        name_starts = array('Q', [0])
+        for name in encoded_names:
+            name_starts.append(name_starts[-1] + len(name))
+
+        names_size = name_starts[-1]
+        sections = [bucket_starts, ids, name_starts]
+        if sys.byteorder != "little":
+            for section in sections:
+                section.byteswap()
+
+        with open(path, "wb") as snapshot:
+            snapshot.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, num_buckets, len(ordered), names_size))
+            for section in sections:
+                section.tofile(snapshot)
+            snapshot.write(b"".join(encoded_names))
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True, **kwargs):
+        """Load a snapshot written by save()
+
+        With mmap=True a read-only MappedHashTable is returned that answers
+        lookups straight from the mapped file pages, so nothing is
+        deserialized up front and processes share the page cache. With
+        mmap=False a regular table is rebuilt; kwargs go to its constructor.
+        """
+        mapped = MappedHashTable(path)
+        if mmap:
+            return mapped
+        try:
+            table = cls(max(1, mapped.size()), **kwargs)
+            table.set_many(mapped.items())
+        finally:
+            mapped.close()
+        return table
+
+
+def _as_id_list(student_ids) -> list:
+    """Turn a key iterable (list, generator, NumPy array) into a list"""
+    # NumPy arrays convert to native ints in C; scalar numpy ints are slow dict/modulo keys
+    if hasattr(student_ids, "tolist"):
+        return student_ids.tolist()
+    return student_ids if isinstance(student_ids, list) else list(student_ids)
+
+
+class MappedHashTable:
+    """Read-only view over a HashTable snapshot file, queried in place via mmap"""
+
+    def __init__(self, path: str):
+        if sys.byteorder != "little":
+            raise OSError("memory-mapped snapshots require a little-endian platform")
+
+        with open(path, "rb") as snapshot:
+            self._mmap = mmap_module.mmap(snapshot.fileno(), 0, access=mmap_module.ACCESS_READ)
+
+        try:
+            magic, num_buckets, num_entries, names_size = _SNAPSHOT_HEADER.unpack_from(self._mmap, 0)
+            if magic != _SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a HashTable snapshot")
+
+            self._view = view = memoryview(self._mmap)
+            offset = _SNAPSHOT_HEADER.size
+            self._bucket_starts = view[offset:offset + 8 * (num_buckets + 1)].cast('Q')
+            offset += 8 * (num_buckets + 1)
+            self._ids = view[offset:offset + 8 * num_entries].cast('q')
+            offset += 8 * num_entries
+            self._name_starts = view[offset:offset + 8 * (num_entries + 1)].cast('Q')
+            offset += 8 * (num_entries + 1)
+            self._names = view[offset:offset + names_size]
+        except Exception:
+            self.close()
+            raise
+
+        self._mask = num_buckets - 1
+        self.current_size = num_entries
+
+    def _index(self, student_id) -> int:
+        """Return the entry index holding student_id, or -1"""
+        # Accepts anything int-like (e.g. NumPy integer scalars), matching HashTable.get
+        try:
+            student_id = operator.index(student_id)
+        except TypeError:
+            return -1
+        bucket = fibonacci_hash(student_id) & self._mask
+        ids = self._ids
+        for idx in range(self._bucket_starts[bucket], self._bucket_starts[bucket + 1]):
+            if ids[idx] == student_id:
+                return idx
+        return -1
+
+    def _name_at(self, idx: int) -> str:
+        return str(self._names[self._name_starts[idx]:self._name_starts[idx + 1]], "utf-8")
+
+    def size(self) -> int:
+        """Return number of entries in the snapshot"""
+        return self.current_size
+
+    def contains(self, student_id) -> bool:
+        """Check if student exists in the snapshot"""
+        return self._index(student_id) >= 0
+
+    def get(self, student_id) -> HashTable.StudentData:
+        """Retrieve the student entry by ID, decoded on demand"""
+        idx = self._index(student_id)
+        if idx < 0:
+            return None
+        return HashTable.StudentData(student_id, self._name_at(idx))
+
+    def get_name(self, student_id) -> str:
+        """Retrieve just the student name"""
+        idx = self._index(student_id)
+        return self._name_at(idx) if idx >= 0 else None
+
+    def get_many(self, student_ids) -> list:
+        """Retrieve the entry (or None) for each id, in order"""
+        return [self.get(student_id) for student_id in _as_id_list(student_ids)]
+
+    def contains_many(self, student_ids) -> list:
+        """Return a bool per id telling whether it is in the snapshot"""
+        return [self._index(student_id) >= 0 for student_id in _as_id_list(student_ids)]
+
+    def items(self):
+        """Yield (student_id, student_name) for every entry"""
+        for idx in range(self.current_size):
+            yield self._ids[idx], self._name_at(idx)
+
+    def close(self) -> None:
+        """Release the memory views and unmap the file"""
+        # Every view must be released before the mapping can be closed
+        for name in ("_bucket_starts", "_ids", "_name_starts", "_names", "_view"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
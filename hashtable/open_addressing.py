@@ -0,0 +1,173 @@
+from array import array
+
+from hashtable import _FIBONACCI_MULTIPLIER, _MASK_64
+
+# Open-addressing alternative to HashTable (hashtable.py)
+# Same set/get/rem/contains/size/reset API, but entries live in flat parallel arrays
+# instead of one StudentData object per record inside per-slot lists:
+#   ids       -> array('q') of int64 student ids
+#   names     -> list of names, same index as ids
+#   distances -> array('i') probe distance from the home slot, -1 marks an empty slot
+# Collisions are resolved with Robin Hood linear probing and deletes use backward shifting,
+# so there are no tombstones to skip over.
+# Slots are picked with the same Fibonacci multiplier as hashtable.fibonacci_hash, keeping the top bits.
+
+
+class OpenAddressingHashTable:
+    class StudentData:
+        """Snapshot of a stored student record returned by get()"""
+        __slots__ = ("student_id", "student_name", "status")
+
+        def __init__(self, student_id: int, student_name: str):
+            self.student_id = student_id
+            self.student_name = student_name
+            self.status = True
+
+    MIN_CAPACITY = 8
+
+    def __init__(self, total_size: int = MIN_CAPACITY, max_load_factor: float = 0.75):
+        """Initialize table with at least total_size slots (rounded up to a power of two)"""
+        if total_size < 1:
+            raise ValueError("total_size must be at least 1")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be in (0, 1)")
+
+        capacity = self.MIN_CAPACITY
+        while capacity < total_size:
+            capacity <<= 1
+
+        self.initial_size = capacity
+        self.max_load_factor = max_load_factor
+        self.current_size = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """Replace the storage arrays with empty ones of the given power-of-two capacity"""
+        self.total_size = capacity
+        self._mask = capacity - 1
+        self._shift = 64 - (capacity.bit_length() - 1)
+        self.ids = array('q', bytes(8 * capacity))
+        self.names = [None] * capacity
+        self.distances = array('i', [-1]) * capacity
+
+    def _home(self, student_id: int) -> int:
+        """Fibonacci hash of the id, taking the top bits so sequential ids spread out"""
+        return ((student_id * _FIBONACCI_MULTIPLIER) & _MASK_64) >> self._shift
+
+    def _index(self, student_id: int) -> int:
+        """Return the slot holding student_id, or -1 if absent"""
+        ids = self.ids
+        distances = self.distances
+        mask = self._mask
+        idx = self._home(student_id)
+        dist = 0
+        while True:
+            slot_dist = distances[idx]
+            # Robin Hood invariant: the key would have displaced any entry closer to home
+            if slot_dist < dist:
+                return -1
+            if ids[idx] == student_id:
+                return idx
+            idx = (idx + 1) & mask
+            dist += 1
+
+    def size(self) -> int:
+        """Return current number of entries"""
+        return self.current_size
+
+    def load_factor(self) -> float:
+        """Return the ratio of entries to slots"""
+        return self.current_size / self.total_size
+
+    def contains(self, student_id: int) -> bool:
+        """Check if student exists in the table"""
+        return self._index(student_id) >= 0
+
+    def get(self, student_id: int) -> StudentData:
+        """Retrieve a snapshot of the student entry by ID"""
+        idx = self._index(student_id)
+        if idx < 0:
+            return None
+        return self.StudentData(student_id, self.names[idx])
+
+    def get_name(self, student_id: int) -> str:
+        """Retrieve just the student name, without allocating a record"""
+        idx = self._index(student_id)
+        return self.names[idx] if idx >= 0 else None
+
+    def set(self, student_id: int, student_name: str) -> None:
+        """Add or update a student entry"""
+        idx = self._index(student_id)
+        if idx >= 0:
+            self.names[idx] = student_name
+            return
+
+        if self.current_size + 1 > self.max_load_factor * self.total_size:
+            self.resize(self.total_size * 2)
+
+        self._insert_new(student_id, student_name)
+        self.current_size += 1
+
+    def _insert_new(self, student_id: int, student_name: str) -> None:
+        """Robin Hood insert of a key known to be absent"""
+        ids = self.ids
+        names = self.names
+        distances = self.distances
+        mask = self._mask
+        idx = self._home(student_id)
+        dist = 0
+        while True:
+            slot_dist = distances[idx]
+            if slot_dist == -1:
+                ids[idx] = student_id
+                names[idx] = student_name
+                distances[idx] = dist
+                return
+            # Take the slot from a richer entry and keep probing with the evicted one
+            if slot_dist < dist:
+                ids[idx], student_id = student_id, ids[idx]
+                names[idx], student_name = student_name, names[idx]
+                distances[idx], dist = dist, slot_dist
+            idx = (idx + 1) & mask
+            dist += 1
+
+    def rem(self, student_id: int) -> None:
+        """Delete a student entry, shifting its probe run back by one"""
+        idx = self._index(student_id)
+        if idx < 0:
+            return
+
+        ids = self.ids
+        names = self.names
+        distances = self.distances
+        mask = self._mask
+        nxt = (idx + 1) & mask
+        while distances[nxt] > 0:
+            ids[idx] = ids[nxt]
+            names[idx] = names[nxt]
+            distances[idx] = distances[nxt] - 1
+            idx = nxt
+            nxt = (nxt + 1) & mask
+
+        ids[idx] = 0
+        names[idx] = None
+        distances[idx] = -1
+        self.current_size -= 1
+
+    def resize(self, new_size: int) -> None:
+        """Reinsert every entry into new_size slots (must be a power of two)"""
+        if new_size & (new_size - 1) or new_size < self.current_size:
+            raise ValueError("new_size must be a power of two that fits every entry")
+
+        old_ids = self.ids
+        old_names = self.names
+        old_distances = self.distances
+        self._allocate(new_size)
+        for idx, dist in enumerate(old_distances):
+            if dist != -1:
+                self._insert_new(old_ids[idx], old_names[idx])
+
+    def reset(self) -> None:
+        """Clear all entries from the table"""
+        self._allocate(self.initial_size)
+        self.current_size = 0
@@ -0,0 +1,77 @@
+import pytest
+from cache import BoundedCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_lru_evicts_least_recently_used():
+    cache = BoundedCache(2, policy="lru")
+    cache.set(1, "One")
+    cache.set(2, "Two")
+    assert cache.get(1).student_name == "One"
+    cache.set(3, "Three")
+    assert cache.contains(1)
+    assert not cache.contains(2)
+    assert cache.contains(3)
+    assert cache.size() == 2
+    assert cache.evictions == 1
+
+def test_lfu_evicts_least_frequently_used():
+    cache = BoundedCache(3, policy="lfu")
+    for student_id in (1, 2, 3):
+        cache.set(student_id, f"Student {student_id}")
+    cache.get(1)
+    cache.get(1)
+    cache.get(3)
+    cache.set(4, "Student 4")
+    assert not cache.contains(2)
+    cache.set(5, "Student 5")
+    # 4 and 5 were each used once; 4 is the older of the two
+    assert not cache.contains(4)
+    assert cache.contains(1) and cache.contains(3) and cache.contains(5)
+    assert cache.evictions == 2
+
+def test_ttl_expires_entries():
+    clock = FakeClock()
+    cache = BoundedCache(4, ttl=10, clock=clock)
+    cache.set(1, "One")
+    clock.now = 5
+    assert cache.get(1).student_name == "One"
+    clock.now = 10
+    assert cache.get(1) is None
+    assert cache.expirations == 1
+    assert cache.size() == 0
+
+def test_hit_miss_counters_and_rem():
+    cache = BoundedCache(4)
+    assert cache.hit_rate() == 0.0
+    cache.set(1, "One")
+    cache.get(1)
+    cache.get(2)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate() == 0.5
+    cache.set(1, "Uno")
+    assert cache.size() == 1
+    cache.rem(1)
+    assert not cache.contains(1)
+    cache.reset()
+    assert cache.size() == 0
+    assert cache.hits == 1
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_stays_within_capacity_under_churn(policy):
+    cache = BoundedCache(50, policy=policy)
+    for student_id in range(5000):
+        cache.set(student_id % 173, "Student")
+        cache.get((student_id * 7) % 173)
+        assert cache.size() <= 50
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        BoundedCache(0)
+    with pytest.raises(ValueError):
+        BoundedCache(10, policy="fifo")
@@ -0,0 +1,66 @@
+import threading
+
+import pytest
+from concurrent_hashtable import ConcurrentHashTable
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_basic_operations():
+    table = ConcurrentHashTable(8, stripes=4)
+    table.set(1, "One")
+    table.set(1, "Uno")
+    assert table.get(1).student_name == "Uno"
+    assert table.contains(1)
+    table.rem(1)
+    table.rem(1)
+    assert not table.contains(1)
+    assert table.size() == 0
+    assert table.dead_count() == 1
+
+def test_concurrent_inserts_of_same_keys_do_not_duplicate():
+    table = ConcurrentHashTable(4, stripes=8)
+
+    def worker(thread_idx):
+        for student_id in range(2000):
+            table.set(student_id, f"Student {student_id}")
+
+    run_threads(worker, 8)
+    assert table.size() == 2000
+    assert sum(len(slot) for slot in table.student_list) == 2000
+    assert table.total_size > 4
+
+def test_concurrent_mixed_workload_keeps_counts_consistent():
+    table = ConcurrentHashTable(16, stripes=4, min_load_factor=0.1)
+
+    def worker(thread_idx):
+        base = thread_idx * 1000
+        table.set_many((base + offset, "Student") for offset in range(1000))
+        for offset in range(0, 1000, 2):
+            table.rem(base + offset)
+        assert all(table.contains_many(range(base + 1, base + 1000, 2)))
+
+    run_threads(worker, 6)
+    assert table.size() == 3000
+    stored = [entry for slot in table.student_list for entry in slot]
+    assert sum(entry.status for entry in stored) == table.live_count()
+    assert len(stored) - table.live_count() == table.dead_count()
+
+def test_incremental_rehash_rejected():
+    with pytest.raises(ValueError):
+        ConcurrentHashTable(8, incremental_rehash=True)
+
+def test_stats_wrap_locked_operations():
+    table = ConcurrentHashTable(4, stripes=2, max_load_factor=100)
+    table.enable_stats()
+    run_threads(lambda thread_idx: [table.set(student_id=student_id, student_name="S") for student_id in range(50)], 4)
+    assert table.size() == 50
+    assert table.get(student_id=49).student_name == "S"
+    report = table.stats()
+    assert report["set"]["calls"] == 200
+    assert report["get"] == {"calls": 1, "avg_probes": 13.0, "max_probes": 13}
+
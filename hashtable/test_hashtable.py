@@ -45,3 +45,312 @@ def test_collision_handling(hash_table):
     assert student20 is not None
     assert student10.student_name == "Student 10"
     assert student20.student_name == "Student 20"
+
+def test_grows_past_max_load_factor(hash_table):
+    for student_id in range(100):
+        hash_table.set(student_id, f"Student {student_id}")
+    assert hash_table.size() == 100
+    assert hash_table.total_size > 10
+    assert hash_table.load_factor() <= hash_table.max_load_factor
+    for student_id in range(100):
+        assert hash_table.get(student_id).student_name == f"Student {student_id}"
+
+def test_shrinks_below_min_load_factor():
+    table = HashTable(4, min_load_factor=0.2)
+    for student_id in range(64):
+        table.set(student_id, f"Student {student_id}")
+    grown_size = table.total_size
+    for student_id in range(60):
+        table.rem(student_id)
+    assert table.total_size < grown_size
+    assert table.total_size >= 4
+    assert table.size() == 4
+    for student_id in range(60, 64):
+        assert table.contains(student_id)
+
+def test_reset_restores_initial_size(hash_table):
+    for student_id in range(50):
+        hash_table.set(student_id, "Student")
+    hash_table.reset()
+    assert hash_table.total_size == 10
+    assert len(hash_table.student_list) == 10
+
+def test_invalid_load_factors():
+    with pytest.raises(ValueError):
+        HashTable(10, max_load_factor=0)
+    with pytest.raises(ValueError):
+        HashTable(10, max_load_factor=1.0, min_load_factor=0.5)
+
+def test_incremental_rehash_keeps_entries_reachable():
+    table = HashTable(4, incremental_rehash=True, rehash_step=1)
+    for student_id in range(4):
+        table.set(student_id, f"Student {student_id}")
+    assert table.is_rehashing()
+    # Every entry stays visible while buckets are still being migrated
+    for student_id in range(4):
+        assert table.contains(student_id)
+    for student_id in range(4, 200):
+        table.set(student_id, f"Student {student_id}")
+    assert table.size() == 200
+    for student_id in range(200):
+        assert table.get(student_id).student_name == f"Student {student_id}"
+
+def test_incremental_rehash_migrates_bounded_buckets():
+    table = HashTable(8, incremental_rehash=True, rehash_step=2)
+    for student_id in range(7):
+        table.set(student_id, "Student")
+    assert table.is_rehashing()
+    assert table.rehash_idx == 0
+    table.get(0)
+    assert table.rehash_idx == 2
+    table.rem(1)
+    assert not table.contains(1)
+    assert table.size() == 6
+    while table.is_rehashing():
+        table.get(0)
+    assert table.old_student_list is None
+    assert sum(entry.status for slot in table.student_list for entry in slot) == 6
+
+def test_remove_twice_counts_once(hash_table):
+    hash_table.set(789, "Alice Brown")
+    hash_table.set(790, "Bob Green")
+    hash_table.rem(789)
+    hash_table.rem(789)
+    assert hash_table.size() == 1
+    assert hash_table.dead_count() == 1
+
+def test_tombstone_reused_by_set(hash_table):
+    hash_table.set(10, "Student 10")
+    hash_table.rem(10)
+    assert hash_table.dead_count() == 1
+    hash_table.set(20, "Student 20")
+    assert hash_table.dead_count() == 0
+    assert hash_table.live_count() == 1
+    assert len(hash_table.get_slot(20)) == 1
+
+def test_bucket_compaction_after_churn():
+    table = HashTable(1, max_load_factor=100)
+    for student_id in range(6):
+        table.set(student_id, "Student")
+    for student_id in range(4):
+        table.rem(student_id)
+    assert table.size() == 2
+    assert table.dead_count() == 0
+    assert len(table.student_list[0]) == 2
+    assert table.contains(4) and table.contains(5)
+
+def test_table_compaction_after_churn():
+    table = HashTable(64, max_load_factor=2)
+    for student_id in range(100):
+        table.set(student_id, "Student")
+    for student_id in range(80):
+        table.rem(student_id)
+    assert table.size() == 20
+    assert table.dead_count() < 80
+    assert table.dead_count() <= table.tombstone_ratio * max(table.size() + table.dead_count(), table.total_size)
+    stored = sum(len(slot) for slot in table.student_list)
+    assert stored == table.live_count() + table.dead_count()
+
+def test_sparse_table_churn_does_not_sweep_every_bucket():
+    table = HashTable(2 ** 14)
+    sweeps = []
+    table.compact = lambda: sweeps.append(table.dead_count())
+    for student_id in range(10):
+        table.set(student_id, "Live")
+    for student_id in range(100, 2100):
+        table.set(student_id, "Churn")
+        table.rem(student_id)
+    assert table.size() == 10
+    assert sweeps == []
+    assert table.dead_count() == 2000
+
+def test_set_many_presizes_and_updates(hash_table):
+    hash_table.set(1, "Old Name")
+    hash_table.set_many((student_id, f"Student {student_id}") for student_id in range(1000))
+    assert hash_table.size() == 1000
+    assert hash_table.total_size >= 1000 / hash_table.max_load_factor
+    assert hash_table.get(1).student_name == "Student 1"
+    assert hash_table.get(999).student_name == "Student 999"
+
+def test_set_many_reuses_tombstones(hash_table):
+    hash_table.set(10, "Student 10")
+    hash_table.rem(10)
+    hash_table.set_many([(20, "Student 20"), (20, "Student 20 again")])
+    assert hash_table.size() == 1
+    assert hash_table.dead_count() == 0
+    assert hash_table.get(20).student_name == "Student 20 again"
+
+def test_get_many_and_contains_many(hash_table):
+    hash_table.set_many([(1, "One"), (2, "Two"), (12, "Twelve")])
+    hash_table.rem(2)
+    entries = hash_table.get_many([1, 2, 12, 99])
+    assert [entry and entry.student_name for entry in entries] == ["One", None, "Twelve", None]
+    assert hash_table.contains_many(iter([12, 2, 1])) == [True, False, True]
+
+def test_get_many_during_incremental_rehash():
+    table = HashTable(4, incremental_rehash=True)
+    table.set_many([(student_id, "Student") for student_id in range(3)])
+    table.set(3, "Student")
+    table.set(4, "Student")
+    assert table.contains_many(range(6)) == [True] * 5 + [False]
+
+def test_bulk_ops_keep_incremental_rehash_bounded():
+    table = HashTable(64, incremental_rehash=True, rehash_step=1)
+    for student_id in range(49):
+        table.set(student_id, f"Student {student_id}")
+    assert table.is_rehashing()
+    assert [entry.student_name for entry in table.get_many([48])] == ["Student 48"]
+    assert table.rehash_idx == 1
+    table.set_many([(student_id, "Updated") for student_id in range(40, 60)])
+    assert table.is_rehashing()
+    assert table.rehash_idx == 21
+    assert table.size() == 60
+    assert [entry.student_name for entry in table.get_many([0, 45, 59])] == ["Student 0", "Updated", "Updated"]
+    while table.is_rehashing():
+        table.get(0)
+    assert table.get_many([39, 40]) == [table.get(39), table.get(40)]
+
+def test_reserve_starts_incremental_rehash():
+    table = HashTable(8, incremental_rehash=True)
+    table.set_many([(student_id, "Student") for student_id in range(5)])
+    table.reserve(100)
+    assert table.is_rehashing()
+    assert table.total_size == 256
+    assert table.contains_many(range(6)) == [True] * 5 + [False]
+
+def test_generic_keys():
+    table = HashTable(8)
+    table.set("alice", "Alice Brown")
+    table.set(("class", 3), "Class 3")
+    assert table.get("alice").student_name == "Alice Brown"
+    assert table.contains(("class", 3))
+    table.rem("alice")
+    assert not table.contains("alice")
+
+@pytest.mark.parametrize("hash_function", ["builtin", "fibonacci", "seeded", lambda key: 7])
+def test_hash_functions_keep_entries_reachable(hash_function):
+    table = HashTable(16, hash_function=hash_function, hash_seed=42)
+    for student_id in range(0, 6400, 64):
+        table.set(student_id, f"Student {student_id}")
+    for student_id in range(0, 6400, 64):
+        assert table.get(student_id).student_name == f"Student {student_id}"
+    assert table.size() == 100
+
+def test_fibonacci_hash_spreads_strided_ids():
+    # Multiples of the table size all land in bucket 0 with plain masking
+    builtin = HashTable(1024, max_load_factor=100)
+    fibonacci = HashTable(1024, max_load_factor=100, hash_function="fibonacci")
+    for student_id in range(0, 1024 * 1024, 1024):
+        builtin.set(student_id, "Student")
+        fibonacci.set(student_id, "Student")
+    assert max(len(slot) for slot in builtin.student_list) == 1024
+    assert max(len(slot) for slot in fibonacci.student_list) < 16
+
+def test_unknown_hash_function():
+    with pytest.raises(ValueError):
+        HashTable(8, hash_function="md5")
+
+def test_save_and_load_mmap(tmp_path, hash_table):
+    hash_table.set_many((student_id, f"Student {student_id}") for student_id in range(-50, 500))
+    hash_table.set(7, "Zoë")
+    hash_table.rem(3)
+    path = str(tmp_path / "students.snap")
+    hash_table.save(path)
+
+    with HashTable.load(path) as mapped:
+        assert mapped.size() == hash_table.size()
+        assert mapped.get(7).student_name == "Zoë"
+        assert mapped.get_name(-50) == "Student -50"
+        assert not mapped.contains(3)
+        assert mapped.get(10 ** 6) is None
+        assert mapped.contains_many([1, 3, 499]) == [True, False, True]
+        assert mapped.get("7") is None and not mapped.contains(7.0)
+
+def test_mmap_snapshot_accepts_numpy_scalars(tmp_path, hash_table):
+    np = pytest.importorskip("numpy")
+    hash_table.set_many((student_id, f"Student {student_id}") for student_id in range(100))
+    path = str(tmp_path / "students.snap")
+    hash_table.save(path)
+    with HashTable.load(path) as mapped:
+        assert mapped.get(np.int64(5)).student_name == "Student 5"
+        assert mapped.contains(np.int32(99))
+        assert not mapped.contains(np.int64(100))
+        assert mapped.contains_many(np.arange(98, 101)) == [True, True, False]
+
+def test_save_and_load_rebuilds_table(tmp_path):
+    table = HashTable(4, incremental_rehash=True)
+    for student_id in range(10):
+        table.set(student_id, f"Student {student_id}")
+    path = str(tmp_path / "students.snap")
+    table.save(path)
+
+    loaded = HashTable.load(path, mmap=False, hash_function="fibonacci")
+    assert isinstance(loaded, HashTable)
+    assert loaded.size() == 10
+    assert loaded.get(9).student_name == "Student 9"
+
+def test_save_empty_and_rejects_non_int_keys(tmp_path, hash_table):
+    path = str(tmp_path / "empty.snap")
+    hash_table.save(path)
+    with HashTable.load(path) as mapped:
+        assert mapped.size() == 0
+        assert not mapped.contains(1)
+    hash_table.set("alice", "Alice")
+    with pytest.raises(TypeError):
+        hash_table.save(path)
+
+def test_stats_disabled_by_default(hash_table):
+    assert "get" not in vars(hash_table)
+    hash_table.set(1, "One")
+    report = hash_table.stats()
+    assert report["size"] == 1
+    assert report["buckets"] == 10
+    assert report["chain_length_histogram"] == {0: 9, 1: 1}
+    assert "get" not in report
+
+def test_stats_record_probes_and_resizes():
+    table = HashTable(4, max_load_factor=100)
+    table.enable_stats()
+    for student_id in (0, 4, 8):
+        table.set(student_id, "Student")  # all in bucket 0
+    table.get(8)
+    table.get(12)
+    table.contains(0)
+    table.rem(4)
+    table.resize(8)
+
+    report = table.stats()
+    assert report["set"] == {"calls": 3, "avg_probes": 1.0, "max_probes": 2}
+    assert report["get"] == {"calls": 2, "avg_probes": 3.0, "max_probes": 3}
+    assert report["contains"]["max_probes"] == 1
+    assert report["resizes"] == [(4, 8)]
+    assert report["dead"] == 0
+    assert report["max_chain_length"] == 2  # 0 and 8 still share bucket 0
+
+def test_disable_stats_restores_plain_methods(hash_table):
+    hash_table.enable_stats()
+    hash_table.set(5, "Five")
+    hash_table.disable_stats()
+    assert "set" not in vars(hash_table)
+    assert hash_table.get(5).student_name == "Five"
+    assert "resizes" not in hash_table.stats()
+
+def test_stats_keep_signatures_and_free_without_gc():
+    import gc
+    import weakref
+    table = HashTable(4, max_load_factor=100)
+    table.enable_stats()
+    table.set(student_id=2, student_name="Two")
+    table.set(6, student_name="Six")
+    table.set(2, "Deux")
+    assert table.get(student_id=2).student_name == "Deux"
+    assert table.contains(student_id=6)
+    assert table.stats()["set"] == {"calls": 3, "avg_probes": 2 / 3, "max_probes": 1}
+    table_ref = weakref.ref(table)
+    gc.disable()
+    try:
+        del table
+        assert table_ref() is None
+    finally:
+        gc.enable()
+
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+from open_addressing import OpenAddressingHashTable
+
+@pytest.fixture
+def hash_table():
+    return OpenAddressingHashTable(10)
+
+def test_initialization(hash_table):
+    assert hash_table.total_size == 16
+    assert hash_table.size() == 0
+    assert len(hash_table.ids) == 16
+
+def test_set_get_and_update(hash_table):
+    hash_table.set(123, "John Doe")
+    student = hash_table.get(123)
+    assert student.student_id == 123
+    assert student.student_name == "John Doe"
+    hash_table.set(123, "Johnny Doe")
+    assert hash_table.get_name(123) == "Johnny Doe"
+    assert hash_table.size() == 1
+
+def test_remove_and_reset(hash_table):
+    hash_table.set(0, "Zero")
+    hash_table.set(789, "Alice Brown")
+    hash_table.rem(789)
+    hash_table.rem(789)
+    assert not hash_table.contains(789)
+    assert hash_table.get(789) is None
+    assert hash_table.contains(0)
+    assert hash_table.size() == 1
+    hash_table.reset()
+    assert hash_table.size() == 0
+    assert not hash_table.contains(0)
+
+def test_matches_dict_under_random_churn(hash_table):
+    rng = random.Random(7)
+    expected = {}
+    for _ in range(5000):
+        student_id = rng.randrange(-500, 500) * 64
+        if rng.random() < 0.6:
+            expected[student_id] = f"Student {student_id}"
+            hash_table.set(student_id, expected[student_id])
+        else:
+            expected.pop(student_id, None)
+            hash_table.rem(student_id)
+    assert hash_table.size() == len(expected)
+    assert hash_table.load_factor() <= hash_table.max_load_factor
+    for student_id in range(-500 * 64, 500 * 64, 64):
+        assert hash_table.get_name(student_id) == expected.get(student_id)
@@ -1 +1,6 @@
-from .minheap import MinHeap
\ No newline at end of file
+from .minheap import MinHeap
+from .indexed_minheap import IndexedMinHeap
+from .numeric_minheap import NumericMinHeap
+from .topk import nsmallest, nlargest, nsmallest_chunked
+from .merge import merge
+from .priority_queue import PriorityQueue, AsyncPriorityQueue
@@ -0,0 +1,223 @@
+import argparse
+import heapq
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from .minheap import MinHeap
+from .numeric_minheap import NumericMinHeap
+
+# Benchmark MinHeap and its backends against heapq
+# Every (backend, workload, distribution, payload, size) case prints one JSON object per line, e.g.
+#   python -m minheap.benchmark_minheap --sizes 1000 100000 --repeat 5 > bench_output.txt
+# so runs can be diffed or loaded into a dataframe to catch regressions. Reported fields:
+#   ops_per_sec  -> heap operations per second for the best of --repeat runs
+#   peak_bytes   -> peak memory allocated while building the heap (tracemalloc, separate run)
+# Workloads: build (heapify an array), insert (n pushes), remove (drain n pops), mixed (random push/pop/pushpop)
+
+
+class Job:
+    __slots__ = ("name", "priority")
+
+    def __init__(self, name, priority):
+        self.name = name
+        self.priority = priority
+
+    # Lets heapq order Job objects directly, which is the wrapper-object style MinHeap(key=...) avoids
+    def __lt__(self, other):
+        return self.priority < other.priority
+
+
+def job_priority(job):
+    return job.priority
+
+
+DISTRIBUTIONS = {
+    "random": lambda rng, size: [rng.random() for _ in range(size)],
+    "sorted": lambda rng, size: [float(i) for i in range(size)],
+    "reversed": lambda rng, size: [float(i) for i in range(size, 0, -1)],
+    "few_unique": lambda rng, size: [float(rng.randrange(8)) for _ in range(size)],
+}
+
+
+class HeapqBackend:
+    name = "heapq"
+    numeric_only = False
+
+    def __init__(self, payload):
+        self.heap = []
+
+    def build(self, values):
+        self.heap = list(values)
+        heapq.heapify(self.heap)
+
+    def insert(self, value):
+        heapq.heappush(self.heap, value)
+
+    def remove(self):
+        return heapq.heappop(self.heap)
+
+    def pushpop(self, value):
+        return heapq.heappushpop(self.heap, value)
+
+    def size(self):
+        return len(self.heap)
+
+
+class MinHeapBackend:
+    name = "MinHeap"
+    numeric_only = False
+    arity = 2
+
+    def __init__(self, payload):
+        self.key = job_priority if payload == "object" else None
+        self.heap = MinHeap([], arity=self.arity, key=self.key)
+
+    def build(self, values):
+        self.heap = MinHeap(values, arity=self.arity, key=self.key)
+
+    def insert(self, value):
+        self.heap.insert(value)
+
+    def remove(self):
+        return self.heap.remove()
+
+    def pushpop(self, value):
+        return self.heap.pushpop(value)
+
+    def size(self):
+        return self.heap.size()
+
+
+class FourAryMinHeapBackend(MinHeapBackend):
+    name = "MinHeap[arity=4]"
+    arity = 4
+
+
+class NumericMinHeapBackend(MinHeapBackend):
+    name = "NumericMinHeap"
+    numeric_only = True
+
+    def __init__(self, payload):
+        self.heap = NumericMinHeap()
+
+    def build(self, values):
+        self.heap = NumericMinHeap(values)
+
+
+BACKENDS = [HeapqBackend, MinHeapBackend, FourAryMinHeapBackend, NumericMinHeapBackend]
+
+
+def make_values(distribution, payload, size, seed):
+    priorities = DISTRIBUTIONS[distribution](random.Random(seed), size)
+    if payload == "object":
+        return [Job(f"job-{idx}", priority) for idx, priority in enumerate(priorities)]
+    return priorities
+
+
+# Each workload runs against a fresh backend and returns how many heap operations it performed
+def run_build(backend, values, rng):
+    backend.build(values)
+    # Counted per element heapified so build rates are comparable across sizes
+    return len(values)
+
+
+def run_insert(backend, values, rng):
+    insert = backend.insert
+    for value in values:
+        insert(value)
+    return len(values)
+
+
+def run_remove(backend, values, rng):
+    remove = backend.remove
+    for _ in range(len(values)):
+        remove()
+    return len(values)
+
+
+def run_mixed(backend, values, rng):
+    backend.build(values[: len(values) // 2])
+    choices = [rng.random() for _ in range(len(values))]
+    for value, choice in zip(values, choices):
+        if choice < 0.4 or backend.size() == 0:
+            backend.insert(value)
+        elif choice < 0.8:
+            backend.remove()
+        else:
+            backend.pushpop(value)
+    return len(values)
+
+
+WORKLOADS = {"build": run_build, "insert": run_insert, "remove": run_remove, "mixed": run_mixed}
+
+
+def time_case(backend_class, workload, payload, values, repeat, seed):
+    """Best-of-repeat ops/sec; setup (copying values, prefilling for remove) is excluded from timing"""
+    best = float("inf")
+    operations = 0
+    for _ in range(repeat):
+        backend = backend_class(payload)
+        if workload == "remove":
+            backend.build(values)
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        operations = WORKLOADS[workload](backend, values, rng)
+        best = min(best, time.perf_counter() - start)
+    return operations / best if best > 0 else float("inf"), best
+
+
+def build_peak_bytes(backend_class, payload, values):
+    tracemalloc.start()
+    try:
+        backend = backend_class(payload)
+        backend.build(values)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(sizes, workloads, distributions, payloads, repeat=3, seed=0, backends=BACKENDS):
+    """Yield one result dict per benchmark case"""
+    for size in sizes:
+        for payload in payloads:
+            for distribution in distributions:
+                values = make_values(distribution, payload, size, seed)
+                for backend_class in backends:
+                    if backend_class.numeric_only and payload != "numeric":
+                        continue
+                    peak_bytes = build_peak_bytes(backend_class, payload, values)
+                    for workload in workloads:
+                        ops_per_sec, seconds = time_case(backend_class, workload, payload, values, repeat, seed)
+                        yield {
+                            "backend": backend_class.name,
+                            "workload": workload,
+                            "distribution": distribution,
+                            "payload": payload,
+                            "size": size,
+                            "ops_per_sec": ops_per_sec,
+                            "seconds": seconds,
+                            "peak_bytes": peak_bytes,
+                            "python": sys.version.split()[0],
+                        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark MinHeap backends against heapq (JSON lines output)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--workloads", nargs="+", choices=sorted(WORKLOADS), default=sorted(WORKLOADS))
+    parser.add_argument("--distributions", nargs="+", choices=sorted(DISTRIBUTIONS), default=sorted(DISTRIBUTIONS))
+    parser.add_argument("--payloads", nargs="+", choices=["numeric", "object"], default=["numeric", "object"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for result in run_benchmarks(args.sizes, args.workloads, args.distributions, args.payloads,
+                                 repeat=args.repeat, seed=args.seed):
+        print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
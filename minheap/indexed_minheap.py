@@ -0,0 +1,131 @@
+# Indexed min heap
+# Every value is stored under a caller-chosen handle (a node id, a job name, ...).
+# Priorities and handles live in two parallel arrays, and a handle -> position map is kept in sync inside
+# siftUp/siftDown, so a handle can be found in O(1) and re-prioritised or removed in O(log n).
+# This keeps one entry per handle instead of pushing duplicates and skipping stale ones (e.g. Dijkstra).
+
+_POP_MIN = object()
+
+
+class IndexedMinHeap:
+    def __init__(self, items=None):
+        # items: iterable of (handle, priority) pairs
+        self.priorities = []
+        self.handles = []
+        self.positions = {}
+        if items is not None:
+            for handle, priority in items:
+                if handle in self.positions:
+                    raise KeyError(f"Duplicate handle: {handle!r}")
+                self.positions[handle] = len(self.handles)
+                self.handles.append(handle)
+                self.priorities.append(priority)
+            for current_idx in range((len(self.handles) - 2) // 2, -1, -1):
+                self.siftDown(current_idx)
+
+    def size(self):
+        return len(self.handles)
+
+    def contains(self, handle):
+        return handle in self.positions
+
+    def priority(self, handle):
+        return self.priorities[self.positions[handle]]
+
+    # Swaps two slots in both arrays and records the handles' new positions
+    def swap(self, i, j):
+        priorities, handles = self.priorities, self.handles
+        priorities[i], priorities[j] = priorities[j], priorities[i]
+        handles[i], handles[j] = handles[j], handles[i]
+        self.positions[handles[i]] = i
+        self.positions[handles[j]] = j
+
+    def siftDown(self, current_idx):
+        priorities = self.priorities
+        end_idx = len(priorities) - 1
+        child_one_idx = current_idx * 2 + 1
+
+        while child_one_idx <= end_idx:
+            child_two_idx = child_one_idx + 1
+            smaller_child_idx = child_two_idx if child_two_idx <= end_idx and priorities[child_two_idx] < priorities[child_one_idx] else child_one_idx
+
+            if priorities[smaller_child_idx] < priorities[current_idx]:
+                self.swap(current_idx, smaller_child_idx)
+                current_idx = smaller_child_idx
+                child_one_idx = current_idx * 2 + 1
+            else:
+                return
+
+    def siftUp(self, current_idx):
+        priorities = self.priorities
+        while current_idx > 0:
+            parent_idx = (current_idx - 1) // 2
+
+            if priorities[current_idx] < priorities[parent_idx]:
+                self.swap(current_idx, parent_idx)
+                current_idx = parent_idx
+            else:
+                return
+
+    # Returns (handle, priority) of the minimum without removing it; raises IndexError when empty
+    def peek(self):
+        return self.handles[0], self.priorities[0]
+
+    def insert(self, handle, priority):
+        if handle in self.positions:
+            raise KeyError(f"Duplicate handle: {handle!r}")
+        self.positions[handle] = len(self.handles)
+        self.handles.append(handle)
+        self.priorities.append(priority)
+        self.siftUp(len(self.handles) - 1)
+
+    # remove() pops the minimum; remove(handle) deletes that handle wherever it sits. Both return (handle, priority)
+    def remove(self, handle=_POP_MIN):
+        if handle is _POP_MIN:
+            if not self.handles:
+                raise IndexError("Heap is empty")
+            idx = 0
+        else:
+            idx = self.positions[handle]
+
+        last_idx = len(self.handles) - 1
+        if idx != last_idx:
+            self.swap(idx, last_idx)
+
+        removed_handle = self.handles.pop()
+        removed_priority = self.priorities.pop()
+        del self.positions[removed_handle]
+
+        # The value moved into idx can be out of place in either direction
+        if idx < len(self.handles):
+            moved_handle = self.handles[idx]
+            self.siftUp(idx)
+            self.siftDown(self.positions[moved_handle])
+        return removed_handle, removed_priority
+
+    # Lowers a handle's priority; raises ValueError if the new priority is larger
+    def decrease_key(self, handle, priority):
+        idx = self.positions[handle]
+        if self.priorities[idx] < priority:
+            raise ValueError("New priority is larger than the current one")
+        self.priorities[idx] = priority
+        self.siftUp(idx)
+
+    # Sets a handle's priority in either direction
+    def update(self, handle, priority):
+        idx = self.positions[handle]
+        old_priority = self.priorities[idx]
+        self.priorities[idx] = priority
+        if priority < old_priority:
+            self.siftUp(idx)
+        else:
+            self.siftDown(idx)
+
+    # Inserts the handle, or lowers its priority if the new one is smaller (the usual Dijkstra relax step)
+    def push_or_decrease(self, handle, priority):
+        idx = self.positions.get(handle)
+        if idx is None:
+            self.insert(handle, priority)
+        elif priority < self.priorities[idx]:
+            self.priorities[idx] = priority
+            self.siftUp(idx)
@@ -0,0 +1,40 @@
+from .minheap import MinHeap
+
+# Lazy k-way merge of already-sorted inputs on top of MinHeap
+# The heap holds exactly one head entry per input that still has items. Each output step yields the root and either
+# replaces it with the next item from the same input (one sift-down) or removes it once that input runs dry.
+# Memory is O(k) for k inputs, so shard files can be merged straight to output, external-sort style.
+
+
+def merge(*iterables, key=None):
+    """Yield the items of the sorted iterables in sorted order
+
+    Every input must already be sorted by key (by the items themselves when key is None).
+    Items with equal keys come out in the order of the inputs they came from.
+    """
+    heads = []
+    for source_idx, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            heads.append((value, source_idx, iterator))
+            break
+
+    if key is None:
+        heap = MinHeap(heads, key=lambda head: (head[0], head[1]))
+    else:
+        heap = MinHeap(heads, key=lambda head: (key(head[0]), head[1]))
+
+    while heap.size() > 1:
+        value, source_idx, iterator = heap.peek()
+        yield value
+        for next_value in iterator:
+            heap.replace((next_value, source_idx, iterator))
+            break
+        else:
+            heap.remove()
+
+    # A single input left: no more comparisons needed
+    if heap.size() == 1:
+        value, _, iterator = heap.remove()
+        yield value
+        yield from iterator
@@ -1,4 +1,5 @@
 from typing import List
+from numbers import Real
 import heapq
 
 #heapq module
@@ -7,20 +8,73 @@ import heapq
 # 3) Use Copilot to test against heapq
 # # my version
 # build minheap from an empty array inserting with insert()
+# arity is the fan-out of each node (2 = binary heap). Children of i are arity*i+1 .. arity*i+arity,
+# so a 4- or 8-ary heap is shallower: fewer swaps on insert, more comparisons per level on remove
+# key orders items by key(item) instead of the items themselves; max_heap puts the largest key at the root.
+# In either case the computed key is cached in a parallel array (for max_heap numbers are negated and other keys,
+# e.g. strings or tuples, are wrapped in _Reversed), so every sift step compares plain keys instead of calling
+# __lt__ on the items themselves
+class _Reversed:
+    """Inverts the ordering of a non-numeric key so the min-heap keeps the largest at the root"""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __le__(self, other):
+        return other.value <= self.value
+
+
 class MinHeap:
-    def __init__(self, array):
+    def __init__(self, array, arity=2, key=None, max_heap=False):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self.key = key
+        self.max_heap = max_heap
         # Do not edit the line below.
         self.__heap = []
+        # Cached sort keys, same index as self.__heap; None when items are compared directly
+        self.__keys = [] if key is not None or max_heap else None
         self.buildHeap(array)
 
+    # Sort key cached for value
+    def key_of(self, value):
+        sort_key = value if self.key is None else self.key(value)
+        if not self.max_heap:
+            return sort_key
+        return -sort_key if isinstance(sort_key, Real) else _Reversed(sort_key)
+
     # example passed in [9, 4, 7, -2, 6, 5]
+    # Floyd's bottom-up heapify: copy the values in, then sift down every parent from the last one up to the root.
+    # Most nodes sit near the bottom and barely move, so this is O(n) instead of O(n log n) for n inserts
     def buildHeap(self, array):
-        # Write your code here.
         if array is None or len(array) == 0:
             return
 
-        for i in range(len(array)):
-            self.insert(array[i])
+        self.__heap.extend(array)
+        if self.__keys is not None:
+            self.__keys.extend(map(self.key_of, array))
+        self.heapify()
+
+    # Restores the heap property over the whole array in O(n), used after bulk appends
+    def heapify(self):
+        heap = self.__heap
+        end_idx = len(heap) - 1
+        for current_idx in range(self.find_parent_idx(end_idx), -1, -1):
+            self.siftDown(current_idx, end_idx, heap)
+
+    # Trusted fast path: an array already sorted by the heap's order satisfies the heap property, so it is only copied
+    @classmethod
+    def from_sorted(cls, sorted_array, arity=2, key=None, max_heap=False):
+        heap = cls([], arity, key, max_heap)
+        heap.__heap = list(sorted_array)
+        if heap.__keys is not None:
+            heap.__keys = list(map(heap.key_of, heap.__heap))
+        return heap
 
     # Takes in a heap as opposed to explicitly using self.__heap as it's also used for testing
     def print_heap_as_array(self):
@@ -29,41 +83,63 @@ class MinHeap:
     def size(self):
         return len(self.__heap)
 
+    # Comparisons use the cached keys when there are any; the items array is swapped alongside them
     def siftDown(self, current_idx, end_idx, heap):
-        # Write your code here.
-        child_one_idx = self.find_left_child_idx(current_idx)
+        arity = self.arity
+        keys = heap if self.__keys is None else self.__keys
+        child_one_idx = current_idx * arity + 1
 
         while child_one_idx <= end_idx:
-            child_two_idx = self.find_right_child_idx(current_idx)
-
-            smaller_child_idx = child_two_idx if child_two_idx != -1 and heap[child_two_idx] < heap[child_one_idx] else child_one_idx
+            if arity == 2:
+                child_two_idx = child_one_idx + 1
+                smaller_child_idx = child_two_idx if child_two_idx <= end_idx and keys[child_two_idx] < keys[child_one_idx] else child_one_idx
+            else:
+                # Smallest of the (up to arity) children that are still inside end_idx
+                last_child_idx = child_one_idx + arity - 1
+                if last_child_idx > end_idx:
+                    last_child_idx = end_idx
+                smaller_child_idx = child_idx = child_one_idx
+                smallest_key = keys[child_idx]
+                while child_idx < last_child_idx:
+                    child_idx += 1
+                    if keys[child_idx] < smallest_key:
+                        smaller_child_idx, smallest_key = child_idx, keys[child_idx]
 
-            if heap[smaller_child_idx] < heap[current_idx]:
-                heap[current_idx], heap[smaller_child_idx] = heap[smaller_child_idx], heap[current_idx]
+            if keys[smaller_child_idx] < keys[current_idx]:
+                keys[current_idx], keys[smaller_child_idx] = keys[smaller_child_idx], keys[current_idx]
+                if keys is not heap:
+                    heap[current_idx], heap[smaller_child_idx] = heap[smaller_child_idx], heap[current_idx]
                 current_idx = smaller_child_idx
-                child_one_idx = current_idx * 2 + 1
+                child_one_idx = current_idx * arity + 1
             else:
                 return
 
     def siftUp(self, current_idx):
-        # Write your code here.
+        heap = self.__heap
+        keys = heap if self.__keys is None else self.__keys
+        arity = self.arity
         while current_idx > 0:
-            parent_idx = self.find_parent_idx(current_idx)
+            parent_idx = (current_idx - 1) // arity
 
-            if self.__heap[current_idx] < self.__heap[parent_idx]:
-                self.__heap[current_idx], self.__heap[parent_idx] = self.__heap[parent_idx], self.__heap[current_idx]
+            if keys[current_idx] < keys[parent_idx]:
+                keys[current_idx], keys[parent_idx] = keys[parent_idx], keys[current_idx]
+                if keys is not heap:
+                    heap[current_idx], heap[parent_idx] = heap[parent_idx], heap[current_idx]
                 current_idx = parent_idx
             else:
                 return
     
+    # First child; for a binary heap this is the left child
     def find_left_child_idx(self, parent_idx):
-        return parent_idx * 2 + 1
+        return parent_idx * self.arity + 1
     
+    # Last child, or -1 if it is past the end of the heap; for a binary heap this is the right child
     def find_right_child_idx(self, parent_idx):
-        return parent_idx * 2 + 2 if parent_idx * 2 + 2 <= len(self.__heap) - 1 else -1
+        last_child_idx = parent_idx * self.arity + self.arity
+        return last_child_idx if last_child_idx <= len(self.__heap) - 1 else -1
     
     def find_parent_idx(self, child_idx):
-        return (child_idx - 1) // 2
+        return (child_idx - 1) // self.arity
 
     def peek(self):
         # Write your code here.
@@ -73,6 +149,10 @@ class MinHeap:
         # Write your code here.
         self.__heap[0], self.__heap[len(self.__heap) - 1] = self.__heap[len(self.__heap) - 1], self.__heap[0]
         removed_value = self.__heap.pop()
+        if self.__keys is not None:
+            keys = self.__keys
+            keys[0] = keys[-1]
+            keys.pop()
         self.siftDown(0, len(self.__heap) - 1, self.__heap)
         return removed_value
 
@@ -80,8 +160,70 @@ class MinHeap:
     def insert(self, value):
         # Write your code here.
         self.__heap.append(value)
+        if self.__keys is not None:
+            self.__keys.append(self.key_of(value))
         self.siftUp(len(self.__heap) - 1)
 
+    # Bulk insert. k sift-ups cost about k * log2(n + k) swaps while re-heapifying costs about n + k,
+    # so large batches relative to the heap are appended and heapified in one pass instead
+    def insert_many(self, values):
+        values = list(values)
+        heap = self.__heap
+        new_size = len(heap) + len(values)
+        if len(values) * new_size.bit_length() > new_size:
+            heap.extend(values)
+            if self.__keys is not None:
+                self.__keys.extend(map(self.key_of, values))
+            self.heapify()
+            return
+
+        for value in values:
+            self.insert(value)
+
+    # Removes and returns the k smallest values in ascending order
+    def pop_many(self, k):
+        heap = self.__heap
+        if k <= 0:
+            return []
+        if k >= len(heap):
+            # Draining everything: a single C-level sort beats k sift-downs
+            if self.__keys is None:
+                popped = sorted(heap)
+            else:
+                order = sorted(range(len(heap)), key=self.__keys.__getitem__)
+                popped = [heap[idx] for idx in order]
+                self.__keys.clear()
+            heap.clear()
+            return popped
+
+        return [self.remove() for _ in range(k)]
+
+    # Pushes value then pops the minimum with a single sift-down (or none if value is the new minimum)
+    def pushpop(self, value):
+        heap = self.__heap
+        keys = self.__keys
+        if keys is None:
+            if not heap or value <= heap[0]:
+                return value
+        else:
+            value_key = self.key_of(value)
+            if not heap or value_key <= keys[0]:
+                return value
+            keys[0] = value_key
+
+        smallest, heap[0] = heap[0], value
+        self.siftDown(0, len(heap) - 1, heap)
+        return smallest
+
+    # Pops the minimum then pushes value with a single sift-down; raises IndexError on an empty heap
+    def replace(self, value):
+        heap = self.__heap
+        smallest, heap[0] = heap[0], value
+        if self.__keys is not None:
+            self.__keys[0] = self.key_of(value)
+        self.siftDown(0, len(heap) - 1, heap)
+        return smallest
+
 #
 #
 #
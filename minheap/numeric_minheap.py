@@ -0,0 +1,142 @@
+from array import array
+import heapq
+
+try:
+    import numpy as np
+except ImportError:  # bulk operations fall back to the C-level sorted()/heapq helpers
+    np = None
+
+# Numeric min heap over a flat array.array buffer
+# Values are stored unboxed (8 bytes each for 'd' floats or 'q' int64 timestamps) instead of one Python object
+# plus a list pointer per element; array.array grows geometrically, so appends stay amortized O(1).
+# Single-item operations sift in place like MinHeap. Bulk operations avoid per-element Python work:
+#   build      -> a sorted array is already a valid min heap, so one native sort replaces heapify
+#   nsmallest  -> np.partition (or heapq.nsmallest) over the buffer, heap left untouched
+#   heapsort   -> one native sort of the buffer, draining the heap
+
+
+class NumericMinHeap:
+    TYPECODES = ("d", "q")
+
+    def __init__(self, values=None, typecode="d"):
+        if typecode not in self.TYPECODES:
+            raise ValueError(f"typecode must be one of {self.TYPECODES}")
+        self.typecode = typecode
+        self.__heap = array(typecode)
+        if values is not None and len(values) > 0:
+            self.build(values)
+
+    def size(self):
+        return len(self.__heap)
+
+    # Contents as a NumPy array sharing the heap's memory (requires numpy).
+    # The heap cannot grow or shrink while the returned view is alive, so keep it short-lived
+    def as_numpy(self):
+        if np is None:
+            raise ImportError("numpy is required for as_numpy()")
+        return np.frombuffer(self.__heap, dtype=self.__heap.typecode)
+
+    # Replaces the contents with values in one native sort (ascending order satisfies the heap property)
+    def build(self, values):
+        if np is not None:
+            sorted_values = np.sort(np.asarray(values, dtype=self.typecode), kind="stable")
+            self.__heap = array(self.typecode, sorted_values.tobytes())
+        else:
+            self.__heap = array(self.typecode, sorted(values))
+
+    # Same sift as MinHeap, specialised to a binary heap of plain numbers
+    def siftDown(self, current_idx, end_idx, heap):
+        child_one_idx = current_idx * 2 + 1
+
+        while child_one_idx <= end_idx:
+            child_two_idx = child_one_idx + 1
+            smaller_child_idx = child_two_idx if child_two_idx <= end_idx and heap[child_two_idx] < heap[child_one_idx] else child_one_idx
+
+            if heap[smaller_child_idx] < heap[current_idx]:
+                heap[current_idx], heap[smaller_child_idx] = heap[smaller_child_idx], heap[current_idx]
+                current_idx = smaller_child_idx
+                child_one_idx = current_idx * 2 + 1
+            else:
+                return
+
+    def siftUp(self, current_idx):
+        heap = self.__heap
+        while current_idx > 0:
+            parent_idx = (current_idx - 1) // 2
+
+            if heap[current_idx] < heap[parent_idx]:
+                heap[current_idx], heap[parent_idx] = heap[parent_idx], heap[current_idx]
+                current_idx = parent_idx
+            else:
+                return
+
+    def peek(self):
+        return self.__heap[0]
+
+    def insert(self, value):
+        self.__heap.append(value)
+        self.siftUp(len(self.__heap) - 1)
+
+    def remove(self):
+        heap = self.__heap
+        smallest = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self.siftDown(0, len(heap) - 1, heap)
+        return smallest
+
+    # Pushes value then pops the minimum with at most one sift-down
+    def pushpop(self, value):
+        heap = self.__heap
+        if not heap or value <= heap[0]:
+            return value
+
+        smallest, heap[0] = heap[0], value
+        self.siftDown(0, len(heap) - 1, heap)
+        return smallest
+
+    # Bulk insert: small batches are sifted in, large ones are merged with a single native sort
+    def insert_many(self, values):
+        if np is not None:
+            values = np.asarray(values, dtype=self.typecode)
+        else:
+            values = array(self.typecode, values)
+        new_size = len(self.__heap) + len(values)
+        if len(values) * new_size.bit_length() > new_size:
+            if np is not None:
+                self.build(np.concatenate((self.as_numpy(), values)))
+            else:
+                self.__heap.extend(values)
+                self.build(self.__heap)
+            return
+
+        for value in values.tolist():
+            self.insert(value)
+
+    # The k smallest values in ascending order, without modifying the heap
+    def nsmallest(self, k):
+        heap = self.__heap
+        k = min(max(k, 0), len(heap))
+        if k == 0:
+            return array(self.typecode)
+        if np is not None:
+            view = self.as_numpy()
+            smallest = np.partition(view, k - 1)[:k] if k < len(view) else view.copy()
+            smallest.sort()
+            return array(self.typecode, smallest.tobytes())
+        return array(self.typecode, heapq.nsmallest(k, heap))
+
+    # Removes and returns the k smallest values in ascending order
+    def pop_many(self, k):
+        if k >= len(self.__heap):
+            return self.heapsort()
+        return array(self.typecode, (self.remove() for _ in range(max(k, 0))))
+
+    # Drains the heap, returning every value in ascending order
+    def heapsort(self):
+        heap = self.__heap
+        self.__heap = array(self.typecode)
+        if np is not None:
+            return array(self.typecode, np.sort(np.frombuffer(heap, dtype=heap.typecode)).tobytes())
+        return array(self.typecode, sorted(heap))
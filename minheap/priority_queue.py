@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from queue import Empty, Full
+
+from .minheap import MinHeap
+
+# Blocking priority queues over MinHeap
+# PriorityQueue      -> for threads: one lock with not_empty / not_full conditions, optional timeouts
+# AsyncPriorityQueue -> for asyncio tasks on one event loop: awaitable put/get, no locking needed
+# maxsize > 0 bounds the queue and makes put() wait (back-pressure) until a consumer makes room; 0 means unbounded.
+# Items come out smallest first, or by key(item) when key is given.
+
+
+class PriorityQueue:
+    def __init__(self, maxsize=0, key=None):
+        self.maxsize = maxsize
+        self.heap = MinHeap([], key=key)
+        self.mutex = threading.Lock()
+        self.not_empty = threading.Condition(self.mutex)
+        self.not_full = threading.Condition(self.mutex)
+
+    def qsize(self):
+        with self.mutex:
+            return self.heap.size()
+
+    def empty(self):
+        return self.qsize() == 0
+
+    def full(self):
+        with self.mutex:
+            return 0 < self.maxsize <= self.heap.size()
+
+    # Waits on condition until ready() holds; raises exception if block is False or the timeout runs out
+    def _wait_for(self, condition, ready, block, timeout, exception):
+        if ready():
+            return
+        if not block:
+            raise exception
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return
+        if timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        deadline = time.monotonic() + timeout
+        while not ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise exception
+            condition.wait(remaining)
+
+    def put(self, item, block=True, timeout=None):
+        with self.not_full:
+            if self.maxsize > 0:
+                self._wait_for(self.not_full, lambda: self.heap.size() < self.maxsize, block, timeout, Full)
+            self.heap.insert(item)
+            self.not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        with self.not_empty:
+            self._wait_for(self.not_empty, self.heap.size, block, timeout, Empty)
+            item = self.heap.remove()
+            self.not_full.notify()
+            return item
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+
+class AsyncPriorityQueue:
+    def __init__(self, maxsize=0, key=None):
+        self.maxsize = maxsize
+        self.heap = MinHeap([], key=key)
+        # Futures of tasks parked in get() / put(), woken one at a time
+        self.getters = deque()
+        self.putters = deque()
+
+    def qsize(self):
+        return self.heap.size()
+
+    def empty(self):
+        return self.heap.size() == 0
+
+    def full(self):
+        return 0 < self.maxsize <= self.heap.size()
+
+    # Use asyncio.wait_for(queue.get(), timeout) for timeouts; a cancelled waiter passes its wake-up on
+    async def _wait(self, waiters, ready):
+        while not ready():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if ready() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    def _wakeup_next(self, waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def put(self, item):
+        await self._wait(self.putters, lambda: not self.full())
+        self.put_nowait(item)
+
+    async def get(self):
+        await self._wait(self.getters, lambda: not self.empty())
+        return self.get_nowait()
+
+    def put_nowait(self, item):
+        if self.full():
+            raise asyncio.QueueFull
+        self.heap.insert(item)
+        self._wakeup_next(self.getters)
+
+    def get_nowait(self):
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self.heap.remove()
+        self._wakeup_next(self.putters)
+        return item
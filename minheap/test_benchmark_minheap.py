@@ -0,0 +1,11 @@
+import json
+
+from minheap.benchmark_minheap import main
+
+
+def test_benchmark_suite_runs(capsys):
+    main(["--sizes", "50", "--repeat", "1", "--distributions", "random", "few_unique"])
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert {result["backend"] for result in results} == {"heapq", "MinHeap", "MinHeap[arity=4]", "NumericMinHeap"}
+    assert {result["workload"] for result in results} == {"build", "insert", "remove", "mixed"}
+    assert all(result["ops_per_sec"] > 0 and result["peak_bytes"] > 0 for result in results)
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+from minheap import IndexedMinHeap
+
+
+def verify_positions(heap):
+    for idx, handle in enumerate(heap.handles):
+        assert heap.positions[handle] == idx
+        left = 2 * idx + 1
+        right = 2 * idx + 2
+        if left < heap.size():
+            assert heap.priorities[idx] <= heap.priorities[left]
+        if right < heap.size():
+            assert heap.priorities[idx] <= heap.priorities[right]
+
+
+def test_build_and_pop_in_order():
+    heap = IndexedMinHeap([("a", 5), ("b", 1), ("c", 3), ("d", 4)])
+    verify_positions(heap)
+    assert heap.peek() == ("b", 1)
+    assert [heap.remove() for _ in range(4)] == [("b", 1), ("c", 3), ("d", 4), ("a", 5)]
+    with pytest.raises(IndexError):
+        heap.remove()
+
+
+def test_decrease_key_update_and_remove_handle():
+    heap = IndexedMinHeap()
+    for handle, priority in [("a", 5), ("b", 7), ("c", 3), ("d", 9)]:
+        heap.insert(handle, priority)
+    heap.decrease_key("d", 1)
+    assert heap.peek() == ("d", 1)
+    heap.update("d", 10)
+    assert heap.peek() == ("c", 3)
+    assert heap.remove("a") == ("a", 5)
+    assert not heap.contains("a")
+    assert heap.priority("d") == 10
+    verify_positions(heap)
+    with pytest.raises(ValueError):
+        heap.decrease_key("c", 4)
+    with pytest.raises(KeyError):
+        heap.insert("c", 0)
+
+
+def test_random_operations_keep_positions_in_sync():
+    rng = random.Random(11)
+    heap = IndexedMinHeap()
+    expected = {}
+    for step in range(3000):
+        handle = rng.randrange(200)
+        priority = rng.randint(-100, 100)
+        action = rng.random()
+        if handle not in expected:
+            heap.insert(handle, priority)
+            expected[handle] = priority
+        elif action < 0.4:
+            heap.update(handle, priority)
+            expected[handle] = priority
+        elif action < 0.7:
+            heap.remove(handle)
+            del expected[handle]
+        else:
+            heap.push_or_decrease(handle, priority)
+            expected[handle] = min(expected[handle], priority)
+    verify_positions(heap)
+    assert heap.size() == len(expected)
+    popped = [heap.remove() for _ in range(heap.size())]
+    assert sorted(priority for _, priority in popped) == [priority for _, priority in popped]
+    assert dict(popped) == expected
+
+
+def test_dijkstra_keeps_one_entry_per_node():
+    graph = {0: [(1, 4), (2, 1)], 1: [(3, 1)], 2: [(1, 2), (3, 5)], 3: []}
+    distances = {}
+    heap = IndexedMinHeap([(0, 0)])
+    while heap.size():
+        node, distance = heap.remove()
+        distances[node] = distance
+        for neighbour, weight in graph[node]:
+            if neighbour not in distances:
+                heap.push_or_decrease(neighbour, distance + weight)
+        assert heap.size() <= len(graph)
+    assert distances == {0: 0, 2: 1, 1: 3, 3: 4}
@@ -0,0 +1,33 @@
+import heapq
+import random
+
+from minheap import merge
+
+
+def test_merge_matches_heapq_merge():
+    rng = random.Random(4)
+    shards = [sorted(rng.randint(0, 1000) for _ in range(rng.randint(0, 50))) for _ in range(20)]
+    assert list(merge(*shards)) == list(heapq.merge(*shards))
+
+
+def test_merge_is_lazy():
+    def sorted_stream(start, step):
+        value = start
+        while True:
+            yield value
+            value += step
+
+    merged = merge(sorted_stream(0, 3), sorted_stream(1, 3), sorted_stream(2, 3))
+    assert [next(merged) for _ in range(10)] == list(range(10))
+
+
+def test_merge_with_key_is_stable():
+    first = [("alice", 1), ("carol", 3)]
+    second = [("bob", 1), ("dave", 2)]
+    merged = list(merge(first, second, key=lambda student: student[1]))
+    assert merged == [("alice", 1), ("bob", 1), ("dave", 2), ("carol", 3)]
+
+
+def test_merge_empty_inputs():
+    assert list(merge()) == []
+    assert list(merge([], [], [1, 2])) == [1, 2]
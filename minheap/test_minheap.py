@@ -157,4 +157,124 @@ def test_manual_heap_matches_heapified_version():
             heap.remove()
             heapq.heappop(arr)
 
-        assert heap.size() == len(arr), f"Mismatched Size"
\ No newline at end of file
+        assert heap.size() == len(arr), f"Mismatched Size"
+
+def test_build_heap_does_not_modify_input():
+    arr = [9, 4, 7, 1, -2, 6, 5, 3]
+    heap = MinHeap(arr)
+    assert arr == [9, 4, 7, 1, -2, 6, 5, 3]
+    assert heap.peek() == -2
+    assert [heap.remove() for _ in range(len(arr))] == sorted(arr)
+
+
+def test_build_heap_large_random_input():
+    import random
+    rng = random.Random(3)
+    arr = [rng.randint(-1000, 1000) for _ in range(2000)]
+    heap = MinHeap(arr)
+    assert heap.size() == len(arr)
+    assert [heap.remove() for _ in range(len(arr))] == sorted(arr)
+
+
+def test_from_sorted():
+    heap = MinHeap.from_sorted([1, 2, 2, 5, 8])
+    heap.insert(0)
+    assert [heap.remove() for _ in range(6)] == [0, 1, 2, 2, 5, 8]
+
+
+def test_insert_many_small_and_large_batches():
+    heap = MinHeap(list(range(100, 0, -1)))
+    heap.insert_many([50, -1, 7])  # small batch: sifted in one by one
+    heap.insert_many(range(200, 400))  # large batch: appended then heapified
+    expected = sorted(list(range(1, 101)) + [50, -1, 7] + list(range(200, 400)))
+    assert heap.pop_many(heap.size()) == expected
+    assert heap.size() == 0
+
+
+def test_pop_many():
+    heap = MinHeap([9, 4, 7, 1, -2, 6, 5, 3])
+    assert heap.pop_many(3) == [-2, 1, 3]
+    assert heap.pop_many(0) == []
+    assert heap.pop_many(10) == [4, 5, 6, 7, 9]
+
+
+def test_pushpop_and_replace_match_heapq():
+    values = [9, 4, 7, 1, -2, 6, 5, 3]
+    heap = MinHeap(values)
+    reference = list(values)
+    heapq.heapify(reference)
+
+    for value in [0, -5, 8, 2, 2, 10]:
+        assert heap.pushpop(value) == heapq.heappushpop(reference, value)
+        assert heap.replace(value) == heapq.heapreplace(reference, value)
+    assert heap.pop_many(heap.size()) == sorted(reference)
+
+    assert MinHeap([]).pushpop(3) == 3
+    with pytest.raises(IndexError):
+        MinHeap([]).replace(3)
+
+
+@pytest.mark.parametrize("arity", [2, 3, 4, 8])
+def test_d_ary_heap_matches_sorted_order(arity):
+    import random
+    rng = random.Random(arity)
+    arr = [rng.randint(-500, 500) for _ in range(500)]
+    heap = MinHeap(arr[:250], arity=arity)
+    for value in arr[250:]:
+        heap.insert(value)
+    heap.insert_many(arr[:10])
+    assert heap.pushpop(1000) == min(arr)
+    assert [heap.remove() for _ in range(heap.size())] == sorted(arr + arr[:10] + [1000])[1:]
+
+
+def test_invalid_arity():
+    with pytest.raises(ValueError):
+        MinHeap([1, 2, 3], arity=1)
+
+
+class Job:
+    def __init__(self, name, priority):
+        self.name = name
+        self.priority = priority
+
+
+def test_key_function_orders_objects():
+    jobs = [Job("build", 3), Job("test", 1), Job("deploy", 5), Job("lint", 2)]
+    heap = MinHeap(jobs, key=lambda job: job.priority)
+    heap.insert(Job("docs", 4))
+    assert heap.peek().name == "test"
+    assert heap.replace(Job("hotfix", 0)).name == "test"
+    assert heap.pushpop(Job("later", 9)).name == "hotfix"
+    names = [heap.remove().name for _ in range(2)] + [job.name for job in heap.pop_many(10)]
+    assert names == ["lint", "build", "docs", "deploy", "later"]
+
+
+@pytest.mark.parametrize("arity", [2, 4])
+def test_max_heap_mode(arity):
+    values = [9, 4, 7, 1, -2, 6, 5, 3]
+    heap = MinHeap(values, arity=arity, max_heap=True)
+    heap.insert_many([10, 0])
+    assert heap.peek() == 10
+    assert heap.pushpop(8) == 10
+    assert [heap.remove() for _ in range(heap.size())] == sorted(values + [0, 8], reverse=True)
+
+
+def test_max_heap_with_key_and_from_sorted():
+    jobs = [Job("a", 1), Job("b", 7), Job("c", 4)]
+    heap = MinHeap(jobs, key=lambda job: job.priority, max_heap=True)
+    assert [job.name for job in heap.pop_many(3)] == ["b", "c", "a"]
+    heap = MinHeap.from_sorted([9, 5, 1], max_heap=True)
+    heap.insert(6)
+    assert heap.pop_many(4) == [9, 6, 5, 1]
+
+
+@pytest.mark.parametrize("arity", [2, 3])
+def test_max_heap_with_non_numeric_keys(arity):
+    heap = MinHeap(["b", "a", "d", "c"], arity=arity, max_heap=True)
+    assert heap.pushpop("e") == "e"
+    assert heap.pushpop("a") == "d"
+    assert [heap.remove() for _ in range(heap.size())] == ["c", "b", "a", "a"]
+    pairs = [(2, "x"), (1, "y"), (2, "a"), (3, "z")]
+    heap = MinHeap(pairs, arity=arity, max_heap=True)
+    heap.insert((0, "w"))
+    assert heap.pop_many(5) == sorted(pairs + [(0, "w")], reverse=True)
@@ -0,0 +1,74 @@
+import heapq
+import random
+
+import pytest
+from minheap import NumericMinHeap
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(5)
+    return [rng.uniform(-1000, 1000) for _ in range(1000)]
+
+
+def test_build_and_remove_in_order(values):
+    heap = NumericMinHeap(values)
+    assert heap.size() == len(values)
+    assert heap.peek() == min(values)
+    assert [heap.remove() for _ in range(10)] == sorted(values)[:10]
+
+
+def test_insert_and_insert_many(values):
+    heap = NumericMinHeap(typecode="q")
+    for value in [5, 3, 9]:
+        heap.insert(value)
+    heap.insert_many([1, 7])  # small batch
+    heap.insert_many(range(100, 0, -1))  # large batch
+    expected = sorted([5, 3, 9, 1, 7] + list(range(1, 101)))
+    assert list(heap.pop_many(5)) == expected[:5]
+    assert list(heap.heapsort()) == expected[5:]
+    assert heap.size() == 0
+
+
+def test_nsmallest_leaves_heap_intact(values):
+    heap = NumericMinHeap(values)
+    assert list(heap.nsmallest(25)) == heapq.nsmallest(25, values)
+    assert list(heap.nsmallest(5000)) == sorted(values)
+    assert list(heap.nsmallest(0)) == []
+    assert heap.size() == len(values)
+
+
+def test_heapsort_drains(values):
+    heap = NumericMinHeap(values)
+    heap.insert(-5000.0)
+    assert list(heap.heapsort()) == sorted(values + [-5000.0])
+    with pytest.raises(IndexError):
+        heap.peek()
+
+
+def test_invalid_typecode():
+    with pytest.raises(ValueError):
+        NumericMinHeap([1, 2], typecode="i")
+
+
+def test_pushpop(values):
+    heap = NumericMinHeap(values)
+    assert heap.pushpop(-2000.0) == -2000.0
+    assert heap.pushpop(2000.0) == min(values)
+    assert heap.size() == len(values)
+
+@pytest.mark.parametrize("typecode", ["d", "q"])
+def test_numpy_branch(values, typecode):
+    np = pytest.importorskip("numpy")
+    from minheap import numeric_minheap
+    assert numeric_minheap.np is np
+    values = [int(value) for value in values] if typecode == "q" else values
+    heap = NumericMinHeap(np.array(values), typecode=typecode)
+    assert heap.peek() == min(values)
+    assert list(heap.nsmallest(10)) == sorted(values)[:10]
+    view = heap.as_numpy()
+    assert view.dtype == np.dtype(typecode) and sorted(view.tolist()) == sorted(values)
+    del view
+    heap.insert_many(np.arange(5))
+    assert list(heap.heapsort()) == sorted(values + list(range(5)))
+    assert heap.size() == 0
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from queue import Empty, Full
+
+import pytest
+from minheap import PriorityQueue, AsyncPriorityQueue
+
+
+def test_priority_order_and_nowait():
+    queue = PriorityQueue()
+    for value in [5, 1, 4, 2]:
+        queue.put(value)
+    assert queue.qsize() == 4
+    assert [queue.get() for _ in range(4)] == [1, 2, 4, 5]
+    with pytest.raises(Empty):
+        queue.get_nowait()
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01)
+
+
+def test_bounded_put_times_out_and_key():
+    queue = PriorityQueue(maxsize=2, key=lambda job: job[0])
+    queue.put((2, "b"))
+    queue.put_nowait((1, "a"))
+    assert queue.full()
+    with pytest.raises(Full):
+        queue.put((0, "c"), timeout=0.01)
+    assert queue.get() == (1, "a")
+
+
+def test_blocking_get_with_producer_threads():
+    queue = PriorityQueue(maxsize=8)
+    results = []
+
+    def producer(start):
+        for value in range(start, 400, 4):
+            queue.put(value)
+
+    def consumer():
+        for _ in range(400):
+            results.append(queue.get(timeout=5))
+
+    threads = [threading.Thread(target=consumer)] + [threading.Thread(target=producer, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(results) == list(range(400))
+    assert queue.empty()
+
+
+def test_async_queue_get_waits_for_put():
+    async def scenario():
+        queue = AsyncPriorityQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+        queue.put_nowait(3)
+        queue.put_nowait(1)
+        first = await getter
+        return first, await queue.get()
+
+    # Both puts land before the waiting getter resumes, so it still sees the smallest
+    assert asyncio.run(scenario()) == (1, 3)
+
+
+def test_async_queue_back_pressure_and_timeout():
+    async def scenario():
+        queue = AsyncPriorityQueue(maxsize=1)
+        await queue.put(5)
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(6)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.put(7), 0.01)
+        putter = asyncio.create_task(queue.put(2))
+        await asyncio.sleep(0)
+        assert await queue.get() == 5
+        await putter
+        assert await queue.get() == 2
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    asyncio.run(scenario())
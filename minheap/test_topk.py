@@ -0,0 +1,60 @@
+import heapq
+import random
+
+import pytest
+from minheap import nsmallest, nlargest, nsmallest_chunked
+
+
+def stream(count, seed=1):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield rng.randint(-10000, 10000)
+
+
+def test_nsmallest_and_nlargest_match_heapq():
+    values = list(stream(5000))
+    assert nsmallest(stream(5000), 20) == heapq.nsmallest(20, values)
+    assert nlargest(stream(5000), 20) == heapq.nlargest(20, values)
+
+
+def test_k_larger_than_input_and_empty():
+    assert nsmallest(iter([3, 1, 2]), 10) == [1, 2, 3]
+    assert nlargest([3, 1, 2], 10) == [3, 2, 1]
+    assert nsmallest([], 5) == []
+    assert nsmallest([1, 2], 0) == []
+
+
+def test_key_function_and_non_numeric_keys():
+    words = ["pear", "fig", "banana", "kiwi", "apple", "cherry"]
+    assert nsmallest(words, 2) == ["apple", "banana"]
+    assert nlargest(words, 2) == ["pear", "kiwi"]
+    assert nsmallest(words, 2, key=len) == ["fig", "pear"]
+    assert nsmallest(words, 3, key=lambda word: word[::-1]) == heapq.nsmallest(3, words, key=lambda word: word[::-1])
+
+
+def test_nsmallest_chunked():
+    values = list(stream(3000, seed=2))
+    chunks = (values[start:start + 256] for start in range(0, len(values), 256))
+    assert nsmallest_chunked(chunks, 15) == sorted(values)[:15]
+    assert nsmallest_chunked([], 3) == []
+
+
+def test_ties_keep_input_order():
+    items = [(i % 5, i) for i in range(100)]
+    assert nsmallest(items, 7, key=lambda item: item[0]) == heapq.nsmallest(7, items, key=lambda item: item[0])
+    assert nlargest(items, 7, key=lambda item: item[0]) == heapq.nlargest(7, items, key=lambda item: item[0])
+    words = ["bb", "aa", "cc", "ab", "dd", "ba"]
+    assert nsmallest(words, 3, key=lambda word: word[1]) == heapq.nsmallest(3, words, key=lambda word: word[1])
+
+def test_nsmallest_chunked_numpy_branch():
+    np = pytest.importorskip("numpy")
+    from minheap import topk
+    assert topk.np is np
+    chunk = np.array([5.0, 1.0, 3.0])
+    assert nsmallest_chunked([chunk], 5) == [1.0, 3.0, 5.0]
+    assert chunk.tolist() == [5.0, 1.0, 3.0]  # caller's data left untouched
+    values = list(stream(3000, seed=3))
+    chunks = [np.array(values[start:start + 500]) for start in range(0, len(values), 500)]
+    result = nsmallest_chunked(chunks, 25)
+    assert isinstance(result, list) and result == sorted(values)[:25]
+    assert nsmallest_chunked(iter([]), 3) == []
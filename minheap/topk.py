@@ -0,0 +1,82 @@
+from itertools import islice
+from numbers import Real
+
+from .minheap import MinHeap
+
+try:
+    import numpy as np
+except ImportError:  # nsmallest_chunked then streams every chunk through the heap
+    np = None
+
+# Streaming top-k selection on a bounded MinHeap
+# Only k items are ever held: the heap root is the worst item kept so far, and each new item either bounces off it
+# (one comparison inside pushpop) or replaces it with a single sift-down. O(n log k) time and O(k) memory, so the
+# input can be a generator over far more records than fit in memory.
+# k smallest -> max-heap on the key (root = largest kept); k largest -> min-heap on the key (root = smallest kept)
+# Items enter the heap as (arrival index, item) and the index breaks key ties, so the latest of equal items is the
+# one evicted and results list equal keys in input order, like heapq.nsmallest/nlargest and sorted()
+
+
+def _select(iterable, k, key, largest):
+    """Return the k best items of iterable, best first"""
+    if k <= 0:
+        return []
+
+    iterator = enumerate(iterable)
+    first_entries = list(islice(iterator, k))
+    if not first_entries:
+        return []
+
+    item_key = (lambda item: item) if key is None else key
+    if largest:
+        # Root = smallest key, latest arrival among equals
+        heap = MinHeap(first_entries, key=lambda entry: (item_key(entry[1]), -entry[0]))
+    elif isinstance(item_key(first_entries[0][1]), Real):
+        # Negating both fields turns the max-heap on (key, index) into a plain min-heap on numbers
+        heap = MinHeap(first_entries, key=lambda entry: (-item_key(entry[1]), -entry[0]))
+    else:
+        heap = MinHeap(first_entries, key=lambda entry: (item_key(entry[1]), entry[0]), max_heap=True)
+
+    pushpop = heap.pushpop
+    for entry in iterator:
+        pushpop(entry)
+
+    kept = heap.pop_many(heap.size())
+    kept.reverse()
+    return [item for _, item in kept]
+
+
+def nsmallest(iterable, k, key=None):
+    """The k smallest items of any iterable/generator, ascending, holding only k items at a time"""
+    return _select(iterable, k, key, largest=False)
+
+
+def nlargest(iterable, k, key=None):
+    """The k largest items of any iterable/generator, descending, holding only k items at a time"""
+    return _select(iterable, k, key, largest=True)
+
+
+def nsmallest_chunked(chunks, k):
+    """The k smallest numbers across an iterable of numeric chunks (e.g. NumPy arrays read from disk), as an ascending list
+
+    With NumPy each chunk is reduced to its own k smallest with np.partition and merged into the running
+    candidates, so per-element work stays in native code. Without NumPy the chunks are streamed through nsmallest.
+    """
+    if k <= 0:
+        return []
+    if np is None:
+        return nsmallest((value for chunk in chunks for value in chunk), k)
+
+    best = None
+    for chunk in chunks:
+        chunk = np.asarray(chunk).ravel()
+        if len(chunk) > k:
+            chunk = np.partition(chunk, k - 1)[:k]
+        best = chunk if best is None else np.concatenate((best, chunk))
+        if len(best) > k:
+            best = np.partition(best, k - 1)[:k]
+
+    if best is None:
+        return []
+    # np.sort copies: with a single short chunk best is still a view of the caller's array
+    return np.sort(best).tolist()
@@ -5,6 +5,14 @@
 # comparator in quick_sort() is taking in 2 objects (height and weight for visual here, but could be anything)
 # callback could be used here
 
+import operator
+from numbers import Real
+
+try:
+    import numpy as np
+except ImportError:  # argsort() then groups and sorts every key type with the introsort engine
+    np = None
+
 # Client code student class example
 class Student:
     def __init__(self, name, height, weight):
@@ -15,7 +23,7 @@ class Student:
     def __repr__(self):
         return f"Student({self.name}, h:{self.height}cm, w:{self.weight}kg)"
 
-def quick_sort(arr, comparator):
+def quick_sort(arr, comparator=None, in_place=False, key=None, reverse=False, stable=False):
     """
     QuickSort with separate comparator and ordering logic
     
@@ -25,28 +33,362 @@ def quick_sort(arr, comparator):
                    Takes two complete objects, returns comparison result
         ordering_callback: Function that takes comparison result and decides ordering
                           Returns True if first should come before second
+        in_place: Sort arr itself instead of a copy, and return arr
+        key: Function extracting a sort key from one object (e.g. height_key, composite_key).
+             Used instead of comparator: every key is computed exactly once up front
+             (decorate-sort-undecorate), so the sort itself only compares plain values
+             A multi-key spec such as [("height", ASC), ("weight", DESC)] is compiled with sort_key()
+        reverse: Sort in the opposite order
+        stable: Keep items that tie under the comparator in their original order, so sorts can be
+                chained (sort by weight, then stably by height). Uses merge_sort() instead of introsort
+    
+    Both modes run the quick_sort_in_place() introsort engine; without in_place it sorts a copy.
+    With neither comparator nor key the objects' own < ordering is used.
+    Sorting by key is always stable.
     """
-    if len(arr) <= 1:
+    if key is not None:
+        if comparator is not None:
+            raise ValueError("pass either comparator or key, not both")
+        if isinstance(key, (list, tuple)):
+            key = sort_key(key)
+        order = argsort([key(item) for item in arr], reverse)
+        result = [arr[idx] for idx in order]
+        if in_place:
+            arr[:] = result
+            return arr
+        return result
+
+    if comparator is None:
+        comparator = operator.gt if reverse else operator.lt
+    elif reverse:
+        ordering = comparator
+        comparator = lambda item1, item2: ordering(item2, item1)
+
+    engine = merge_sort if stable else quick_sort_in_place
+    if in_place:
+        engine(arr, comparator)
         return arr
+
+    result = list(arr)
+    engine(result, comparator)
+    return result
+
+def argsort(keys, reverse=False):
+    """
+    Permutation (list of indices) that sorts keys; items with equal keys keep their original order
     
-    pivot = arr[len(arr) // 2]
+    Keys that are all ints or all floats are sorted with NumPy's stable argsort when NumPy is installed.
+    Otherwise the indices are grouped by key in one pass, only the distinct keys are sorted by the
+    introsort engine (comparing plain values, no index tiebreak), and the groups are concatenated in
+    that order. Each group is already in input order, and repeated keys such as heights cost one dict
+    lookup instead of a place in the sort. Unhashable keys fall back to sorting (key, index) pairs.
+    """
+    if np is not None and len(keys) > 0:
+        order = _numpy_argsort(keys, reverse)
+        if order is not None:
+            return order
+
+    groups = {}
+    try:
+        for idx, sort_key in enumerate(keys):
+            group = groups.get(sort_key)
+            if group is None:
+                groups[sort_key] = [idx]
+            else:
+                group.append(idx)
+    except TypeError:
+        return _argsort_pairs(keys, reverse)
+
+    distinct_keys = list(groups)
+    quick_sort_in_place(distinct_keys, operator.gt if reverse else operator.lt)
+    order = []
+    for sort_key in distinct_keys:
+        order += groups[sort_key]
+    return order
+
+def _numpy_argsort(keys, reverse):
+    """Stable NumPy argsort of keys that are all ints or all floats, or None for any other keys"""
+    key_type = type(keys[0])
+    if key_type not in (int, float) or not all(type(sort_key) is key_type for sort_key in keys):
+        return None
+    try:
+        # Mixed int/float keys never get here, so no int is rounded to float64
+        key_array = np.asarray(keys, dtype=np.int64 if key_type is int else np.float64)
+    except (ValueError, OverflowError):  # ints beyond int64
+        return None
+
+    if not reverse:
+        return np.argsort(key_array, kind="stable").tolist()
+    # Stable descending order: stable-sort the reversed array, then map back
+    return (len(key_array) - 1 - np.argsort(key_array[::-1], kind="stable")[::-1]).tolist()
+
+def _argsort_pairs(keys, reverse):
+    """argsort() for unhashable keys: sort (key, index) pairs, the index breaking ties"""
+    if reverse:
+        # Negated indices keep ties in their original order under descending comparison
+        decorated = [(sort_key, -idx) for idx, sort_key in enumerate(keys)]
+        quick_sort_in_place(decorated, operator.gt)
+        return [-idx for _, idx in decorated]
+
+    decorated = [(sort_key, idx) for idx, sort_key in enumerate(keys)]
+    quick_sort_in_place(decorated, operator.lt)
+    return [idx for _, idx in decorated]
+
+# Multi-key sort specs: [(field, ASC or DESC), ...], where field is an attribute name or a key function
+ASC = "asc"
+DESC = "desc"
+
+class _Descending:
+    """Inverts the ordering of a non-numeric key (e.g. a name) inside an ascending tuple key"""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    # Hashable like the wrapped value, so argsort() can still group equal keys
+    def __hash__(self):
+        return hash(self.value)
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __gt__(self, other):
+        return self.value < other.value
+
+def _descending_getter(getter):
+    """Wrap a field getter so it returns the descending form of the value: numbers negated, anything else wrapped"""
+    def descending(item):
+        value = getter(item)
+        # Exact type checks first: the Real ABC check is much slower than negating a plain int/float
+        if type(value) is int or type(value) is float or isinstance(value, Real):
+            return -value
+        return _Descending(value)
+    return descending
+
+def sort_key(spec):
+    """
+    Compile a multi-key spec into one key function for quick_sort(arr, key=...)
     
-    left = []
-    right = []
+    sort_key([("height", ASC), ("weight", DESC)]) returns a function mapping a student to a tuple
+    such as (170, -65), so each student's fields are read once and the sort compares plain tuples,
+    instead of a composite comparator re-reading every field on every comparison.
+    """
+    getters = []
+    for field, direction in spec:
+        if direction not in (ASC, DESC):
+            raise ValueError(f"direction must be ASC or DESC, got {direction!r}")
+        getter = field if callable(field) else operator.attrgetter(field)
+        getters.append(_descending_getter(getter) if direction == DESC else getter)
+    if not getters:
+        raise ValueError("sort spec needs at least one field")
+
+    # All ascending attributes: attrgetter builds the whole tuple in C
+    if all(isinstance(field, str) and direction == ASC for field, direction in spec):
+        return operator.attrgetter(*(field for field, _ in spec))
+
+    # Short specs build their tuple directly; a generator per item costs more than the field reads
+    if len(getters) == 1:
+        return getters[0]
+    if len(getters) == 2:
+        first, second = getters
+        return lambda item: (first(item), second(item))
+    if len(getters) == 3:
+        first, second, third = getters
+        return lambda item: (first(item), second(item), third(item))
+    return lambda item: tuple([getter(item) for getter in getters])
+
+# Introsort tuning
+INSERTION_SORT_THRESHOLD = 16  # ranges this small are finished with insertion sort
+NINTHER_THRESHOLD = 40  # ranges at least this big pick the pivot with Tukey's ninther
+
+def quick_sort_in_place(arr, comparator, low=0, high=None):
+    """
+    In-place introsort of arr[low..high] (inclusive) using the same comparator contract as quick_sort()
     
-    for item in arr:
+    - No recursion: pending ranges live on an explicit stack, and the smaller side of each
+      partition is handled first so the stack holds O(log n) ranges
+    - Pivot is the median of three (or Tukey's ninther on large ranges), so sorted, reversed
+      and organ-pipe inputs partition evenly
+    - A range that is still being partitioned past 2*log2(n) levels is heap sorted instead,
+      bounding the worst case at O(n log n)
+    - Ranges of INSERTION_SORT_THRESHOLD or fewer items are insertion sorted
+    """
+    if high is None:
+        high = len(arr) - 1
+    if high - low < 1:
+        return
 
-        if item == pivot:
+    depth_limit = 2 * (high - low + 1).bit_length()
+    stack = [(low, high, depth_limit)]
+
+    while stack:
+        low, high, depth = stack.pop()
+
+        if high - low < INSERTION_SORT_THRESHOLD:
+            insertion_sort(arr, comparator, low, high)
             continue
+        if depth == 0:
+            heap_sort(arr, comparator, low, high)
+            continue
+
+        equal_start, equal_end = partition(arr, comparator, low, high)
+
+        # Items equal to the pivot are already in place; push the larger side first so the smaller one is processed next
+        left, right = (low, equal_start - 1), (equal_end + 1, high)
+        if left[1] - left[0] > right[1] - right[0]:
+            stack.append((*left, depth - 1))
+            stack.append((*right, depth - 1))
+        else:
+            stack.append((*right, depth - 1))
+            stack.append((*left, depth - 1))
+
+def median_of_three(arr, comparator, i, j, k):
+    """Index of the median of arr[i], arr[j], arr[k] under comparator"""
+    if comparator(arr[i], arr[j]):
+        if comparator(arr[j], arr[k]):
+            return j
+        return k if comparator(arr[i], arr[k]) else i
+    if comparator(arr[i], arr[k]):
+        return i
+    return k if comparator(arr[j], arr[k]) else j
+
+def choose_pivot_idx(arr, comparator, low, high):
+    """Median of first/middle/last, or Tukey's ninther (median of three medians) for large ranges"""
+    mid = (low + high) // 2
+    if high - low + 1 < NINTHER_THRESHOLD:
+        return median_of_three(arr, comparator, low, mid, high)
+
+    step = (high - low + 1) // 8
+    return median_of_three(
+        arr, comparator,
+        median_of_three(arr, comparator, low, low + step, low + 2 * step),
+        median_of_three(arr, comparator, mid - step, mid, mid + step),
+        median_of_three(arr, comparator, high - 2 * step, high - step, high),
+    )
 
-        comparison_result = comparator(item, pivot)
-        
-        if comparison_result:  
-            left.append(item)
-        else:  
-            right.append(item)
+def partition(arr, comparator, low, high):
+    """
+    Three-way (Dutch national flag) partition of arr[low..high] around the chosen pivot
     
-    return quick_sort(left, comparator) + [pivot] + quick_sort(right, comparator)
+    Returns (equal_start, equal_end): afterwards arr[low..equal_start-1] sorts before the pivot,
+    arr[equal_start..equal_end] ties with it and arr[equal_end+1..high] sorts after it. Ties are
+    decided by the comparator, not by ==, so students with the same height but different
+    identities are grouped together and never partitioned again.
+    """
+    pivot = arr[choose_pivot_idx(arr, comparator, low, high)]
+
+    # Strict comparators (<) say False for pivot vs itself, non-strict ones (>=) say True.
+    # Either way one call settles most items and a second call is only needed to detect a tie.
+    non_strict = comparator(pivot, pivot)
+
+    less_end = low  # arr[low..less_end-1] sorts before the pivot
+    idx = low  # arr[less_end..idx-1] ties with the pivot
+    greater_start = high  # arr[greater_start+1..high] sorts after the pivot
+    while idx <= greater_start:
+        item = arr[idx]
+        if non_strict:
+            if not comparator(item, pivot):
+                order = 1
+            else:
+                order = 0 if comparator(pivot, item) else -1
+        elif comparator(item, pivot):
+            order = -1
+        else:
+            order = 1 if comparator(pivot, item) else 0
+
+        if order < 0:
+            arr[idx], arr[less_end] = arr[less_end], item
+            less_end += 1
+            idx += 1
+        elif order > 0:
+            arr[idx], arr[greater_start] = arr[greater_start], item
+            greater_start -= 1
+        else:
+            idx += 1
+
+    return less_end, greater_start
+
+def insertion_sort(arr, comparator, low, high):
+    """Insertion sort of arr[low..high]; fastest option for short ranges"""
+    for idx in range(low + 1, high + 1):
+        item = arr[idx]
+        prev_idx = idx - 1
+        while prev_idx >= low and comparator(item, arr[prev_idx]):
+            arr[prev_idx + 1] = arr[prev_idx]
+            prev_idx -= 1
+        arr[prev_idx + 1] = item
+
+def heap_sort(arr, comparator, low, high):
+    """Heap sort of arr[low..high], the introsort fallback once partitioning goes too deep"""
+    size = high - low + 1
+
+    def sift_down(root, end):
+        # Heap ordered so the item that sorts last is at the root (offsets are relative to low)
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end and comparator(arr[low + child], arr[low + child + 1]):
+                child += 1
+            if comparator(arr[low + root], arr[low + child]):
+                arr[low + root], arr[low + child] = arr[low + child], arr[low + root]
+                root = child
+            else:
+                return
+
+    for root in range(size // 2 - 1, -1, -1):
+        sift_down(root, size)
+    for end in range(size - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        sift_down(0, end)
+
+def merge_sort(arr, comparator, low=0, high=None):
+    """
+    Stable in-place merge sort of arr[low..high] (inclusive) using the same comparator contract as quick_sort()
+    
+    - Runs of INSERTION_SORT_THRESHOLD items are insertion sorted, then merged bottom-up (no recursion)
+    - Adjacent runs that are already in order are not merged, so presorted input costs O(n) comparisons
+    - Merging copies only the left run to a buffer, so extra memory is at most n/2 items
+    """
+    if high is None:
+        high = len(arr) - 1
+    if high - low < 1:
+        return
+
+    # Stability needs a strict "comes before": a non-strict comparator (>=) is flipped into one (not b >= a)
+    if comparator(arr[low], arr[low]):
+        ordering = comparator
+        comparator = lambda item1, item2: not ordering(item2, item1)
+
+    for run_low in range(low, high + 1, INSERTION_SORT_THRESHOLD):
+        insertion_sort(arr, comparator, run_low, min(run_low + INSERTION_SORT_THRESHOLD - 1, high))
+
+    width = INSERTION_SORT_THRESHOLD
+    while width <= high - low:
+        for left_low in range(low, high + 1, 2 * width):
+            mid = left_low + width - 1
+            if mid >= high or not comparator(arr[mid + 1], arr[mid]):
+                continue
+            merge(arr, comparator, left_low, mid, min(mid + width, high))
+        width *= 2
+
+def merge(arr, comparator, low, mid, high):
+    """Merge sorted arr[low..mid] and arr[mid+1..high]; on ties the left item goes first"""
+    left = arr[low:mid + 1]
+    left_idx, right_idx, out_idx = 0, mid + 1, low
+    while left_idx < len(left) and right_idx <= high:
+        if comparator(arr[right_idx], left[left_idx]):
+            arr[out_idx] = arr[right_idx]
+            right_idx += 1
+        else:
+            arr[out_idx] = left[left_idx]
+            left_idx += 1
+        out_idx += 1
+    # Any right-run leftovers are already in place
+    arr[out_idx:out_idx + len(left) - left_idx] = left[left_idx:]
 
 # COMPARATOR FUNCTIONS - Extract/compare values from complete Student objects
 def height_comparator_ascending(student1, student2):
@@ -87,6 +429,28 @@ def composite_comparator_ascending(student1, student2):
     else:
         return student1.weight < student2.weight  # Tie-breaker
 
+# KEY FUNCTIONS - Extract one sort key per Student, for quick_sort(arr, key=...)
+# Each is called once per student instead of twice per comparison
+def height_key(student):
+    """Sort key: height"""
+    return student.height
+
+def weight_key(student):
+    """Sort key: weight"""
+    return student.weight
+
+def name_key(student):
+    """Sort key: name"""
+    return student.name
+
+def bmi_key(student):
+    """Sort key: BMI (weight/height²), computed once per student"""
+    return student.weight / ((student.height/100) ** 2)
+
+def composite_key(student):
+    """Sort key: height first, then weight as the tie-breaker (tuples compare element by element)"""
+    return (student.height, student.weight)
+
 
 # EXAMPLE USAGE AND TESTING
 if __name__ == "__main__":
@@ -0,0 +1,208 @@
+import random
+
+import pytest
+from quicksort import (
+    Student,
+    quick_sort,
+    quick_sort_in_place,
+    height_comparator_ascending,
+    height_comparator_descending,
+    composite_comparator_ascending,
+)
+
+
+@pytest.fixture
+def students():
+    return [
+        Student("Alice", 165, 55),
+        Student("Bob", 180, 75),
+        Student("Charlie", 170, 65),
+        Student("Diana", 160, 50),
+        Student("Eve", 175, 60),
+        Student("Frank", 185, 80),
+        Student("Rod", 169, 74),
+    ]
+
+
+def test_quick_sort_height_ascending(students):
+    result = quick_sort(students, height_comparator_ascending)
+    assert [student.height for student in result] == sorted(student.height for student in students)
+
+
+def test_in_place_sorts_callers_list(students):
+    original = list(students)
+    result = quick_sort(students, height_comparator_descending, in_place=True)
+    assert result is students
+    assert [student.height for student in students] == sorted((student.height for student in original), reverse=True)
+    assert sorted(map(id, students)) == sorted(map(id, original))
+
+
+def test_in_place_matches_sorted_on_random_numbers():
+    rng = random.Random(9)
+    for size in [0, 1, 2, 3, 10, 500]:
+        values = [rng.randint(-50, 50) for _ in range(size)]
+        expected = sorted(values)
+        quick_sort_in_place(values, lambda a, b: a < b)
+        assert values == expected
+
+
+def test_in_place_composite_comparator():
+    students = [Student(f"S{i}", 160 + i % 3, 50 + i % 5) for i in range(30)]
+    quick_sort_in_place(students, composite_comparator_ascending)
+    keys = [(student.height, student.weight) for student in students]
+    assert keys == sorted(keys)
+
+
+def test_duplicates_equal_to_pivot_are_kept():
+    values = [3, 1, 3, 2, 3, 3]
+    assert quick_sort(values, lambda a, b: a < b) == [1, 2, 3, 3, 3, 3]
+
+
+@pytest.mark.parametrize("pattern", ["sorted", "reversed", "organ_pipe", "all_equal", "random"])
+def test_large_adversarial_inputs_do_not_recurse(pattern):
+    size = 20000
+    if pattern == "sorted":
+        values = list(range(size))
+    elif pattern == "reversed":
+        values = list(range(size, 0, -1))
+    elif pattern == "organ_pipe":
+        values = list(range(size // 2)) + list(range(size // 2, 0, -1))
+    elif pattern == "all_equal":
+        values = [7] * size
+    else:
+        rng = random.Random(1)
+        values = [rng.random() for _ in range(size)]
+    assert quick_sort(values, lambda a, b: a < b) == sorted(values)
+    assert quick_sort(values, lambda a, b: a >= b) == sorted(values, reverse=True)
+
+
+def test_heap_sort_fallback_and_insertion_sort():
+    from quicksort import heap_sort, insertion_sort
+    rng = random.Random(2)
+    values = [rng.randint(0, 100) for _ in range(200)]
+    expected = values[:50] + sorted(values[50:150]) + values[150:]
+    heap_sort(values, lambda a, b: a < b, 50, 149)
+    assert values == expected
+    values = [5, 2, 9, 1]
+    insertion_sort(values, lambda a, b: a >= b, 0, 3)
+    assert values == [9, 5, 2, 1]
+
+
+def test_three_way_partition_groups_ties():
+    from quicksort import partition
+    students = [Student(f"S{i}", [170, 160, 180][i % 3], 60) for i in range(30)]
+    for comparator in (height_comparator_ascending, height_comparator_descending):
+        arr = list(students)
+        equal_start, equal_end = partition(arr, comparator, 0, len(arr) - 1)
+        pivot_height = arr[equal_start].height
+        assert all(student.height == pivot_height for student in arr[equal_start:equal_end + 1])
+        assert equal_end - equal_start + 1 == 10
+        assert all(comparator(student, arr[equal_start]) for student in arr[:equal_start])
+
+
+def test_heavy_duplicate_students_are_all_kept():
+    rng = random.Random(6)
+    students = [Student(f"S{i}", rng.randint(150, 155), 60) for i in range(20000)]
+    result = quick_sort(students, height_comparator_ascending)
+    assert len(result) == len(students)
+    assert {id(student) for student in result} == {id(student) for student in students}
+    assert [student.height for student in result] == sorted(student.height for student in students)
+    result = quick_sort(students, height_comparator_descending)
+    assert [student.height for student in result] == sorted((student.height for student in students), reverse=True)
+
+
+def test_key_sort_matches_comparator_sort(students):
+    from quicksort import bmi_key, bmi_comparator_ascending, composite_key
+    by_comparator = quick_sort(students, bmi_comparator_ascending)
+    by_key = quick_sort(students, key=bmi_key)
+    assert [student.name for student in by_key] == [student.name for student in by_comparator]
+    by_key = quick_sort(students, key=composite_key)
+    assert [composite_key(student) for student in by_key] == sorted(map(composite_key, students))
+
+
+def test_key_computed_once_per_item(students):
+    calls = []
+
+    def counting_key(student):
+        calls.append(student)
+        return student.weight
+
+    result = quick_sort(students, key=counting_key, reverse=True)
+    assert len(calls) == len(students)
+    assert [student.weight for student in result] == sorted((student.weight for student in students), reverse=True)
+
+
+def test_key_sort_in_place_and_ties_keep_order():
+    from quicksort import height_key
+    students = [Student(f"S{i}", [170, 160][i % 2], 60) for i in range(10)]
+    original = list(students)
+    quick_sort(students, key=height_key, in_place=True)
+    assert [student.name for student in students] == [s.name for s in original if s.height == 160] + [s.name for s in original if s.height == 170]
+    result = quick_sort(original, key=height_key, reverse=True)
+    assert [student.name for student in result] == [s.name for s in original if s.height == 170] + [s.name for s in original if s.height == 160]
+
+
+def test_natural_order_reverse_and_argsort():
+    from quicksort import argsort
+    assert quick_sort([3, 1, 2]) == [1, 2, 3]
+    assert quick_sort([3, 1, 2], reverse=True) == [3, 2, 1]
+    assert quick_sort([3, 1, 2], lambda a, b: a < b, reverse=True) == [3, 2, 1]
+    assert argsort([30, 10, 20, 10]) == [1, 3, 2, 0]
+    assert argsort([30, 10, 20, 10], reverse=True) == [0, 2, 1, 3]
+    with pytest.raises(ValueError):
+        quick_sort([1], lambda a, b: a < b, key=abs)
+
+
+def test_stable_mode_supports_chained_sorts():
+    from quicksort import weight_comparator_ascending
+    rng = random.Random(5)
+    roster = [Student(f"S{i}", rng.choice([160, 170, 180]), rng.choice([50, 60, 70])) for i in range(200)]
+    by_weight = quick_sort(roster, weight_comparator_ascending, stable=True)
+    result = quick_sort(by_weight, height_comparator_descending, stable=True)
+    expected = sorted(roster, key=lambda student: (-student.height, student.weight, int(student.name[1:])))
+    assert [student.name for student in result] == [student.name for student in expected]
+
+
+def test_merge_sort_keeps_ties_in_order():
+    from quicksort import merge_sort
+    rng = random.Random(9)
+    pairs = [(rng.randrange(4), idx) for idx in range(100)]
+    merge_sort(pairs, lambda a, b: a[0] < b[0])
+    assert pairs == sorted(pairs)
+    presorted = list(range(50))
+    quick_sort(presorted, in_place=True, stable=True, reverse=True)
+    assert presorted == list(range(49, -1, -1))
+
+
+def test_multi_key_spec():
+    from quicksort import ASC, DESC, sort_key
+    roster = [Student("Cy", 170, 60), Student("Al", 170, 70), Student("Bo", 160, 70), Student("Di", 170, 70)]
+    result = quick_sort(roster, key=[("height", ASC), ("weight", DESC)])
+    assert [student.name for student in result] == ["Bo", "Al", "Di", "Cy"]
+    result = quick_sort(roster, key=sort_key([("weight", ASC), ("name", DESC)]))
+    assert [student.name for student in result] == ["Cy", "Di", "Bo", "Al"]
+    assert sort_key([("height", ASC), ("weight", ASC)])(roster[0]) == (170, 60)
+    assert quick_sort(roster, key=[(lambda student: student.name[1], ASC)])[0].name == "Di"
+    with pytest.raises(ValueError):
+        sort_key([("height", "up")])
+
+
+def test_key_sort_with_mixed_and_unhashable_keys():
+    assert quick_sort(["ab", "c", "def"], key=lambda word: tuple(word)) == ["ab", "c", "def"]
+    assert quick_sort([2**60 + 1, 2**60, 0.5], key=lambda value: value) == [0.5, 2**60, 2**60 + 1]
+    assert quick_sort([2**70, -1, 2**64], key=lambda value: value, reverse=True) == [2**70, 2**64, -1]
+    rows = [[2, "b"], [1, "z"], [2, "a"], [1, "z"]]
+    assert quick_sort(rows, key=lambda row: row) == sorted(rows)
+    assert quick_sort(rows, key=lambda row: row[:1], reverse=True) == [[2, "b"], [2, "a"], [1, "z"], [1, "z"]]
+
+
+@pytest.mark.parametrize("values", [
+    [random.Random(3).randint(-50, 50) for _ in range(300)],
+    [random.Random(4).random() for _ in range(300)] + [0.5] * 20,
+])
+def test_argsort_numpy_branch(values):
+    np = pytest.importorskip("numpy")
+    import quicksort
+    assert quicksort.np is np
+    assert quicksort.argsort(values) == sorted(range(len(values)), key=values.__getitem__)
+    assert quicksort.argsort(values, reverse=True) == sorted(range(len(values)), key=values.__getitem__, reverse=True)